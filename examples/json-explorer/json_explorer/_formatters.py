@@ -0,0 +1,85 @@
+"""
+Record formatters: the per-record hot path of chunking.
+
+Kept as plain, fully annotated functions so this module can be compiled
+with mypyc for multi-million-message exports:
+
+    mypyc json_explorer/_formatters.py
+
+A compiled extension shadows this file through the normal import
+machinery, so callers need no special handling; without it the
+pure-Python version is used.
+"""
+
+import json
+from typing import Optional
+
+# orjson (if available) serializes straight to UTF-8 bytes in C.
+# Unlike other modules there's no `orjson = None` fallback: this module
+# must stay type-clean for mypyc, and orjson is only touched under HAS_ORJSON.
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_compact(value: dict) -> str:
+    """Serialize to compact JSON, decoding orjson's bytes exactly once."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            # Non-str keys, oversized ints, etc. - stdlib handles these
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def format_discord_message(record: dict) -> str:
+    """Format a Discord message for readability."""
+    author = record.get("author", {})
+    if isinstance(author, dict):
+        author_name = author.get("name", author.get("username", "Unknown"))
+    else:
+        author_name = str(author)
+    
+    timestamp = record.get("timestamp", "")
+    content = record.get("content", "")
+    
+    # Include attachments info
+    attachments = record.get("attachments", [])
+    attachment_str = ""
+    if attachments:
+        attachment_str = f" [+{len(attachments)} attachment(s)]"
+    
+    # Include embeds info
+    embeds = record.get("embeds", [])
+    embed_str = ""
+    if embeds:
+        embed_str = f" [+{len(embeds)} embed(s)]"
+    
+    return f"[{timestamp}] {author_name}: {content}{attachment_str}{embed_str}"
+
+
+def format_slack_message(record: dict) -> str:
+    """Format a Slack message for readability."""
+    user = record.get("user", "Unknown")
+    ts = record.get("ts", "")
+    text = record.get("text", "")
+    
+    return f"[{ts}] {user}: {text}"
+
+
+def format_generic_record(record: dict, content_field: Optional[str] = None) -> str:
+    """Format a generic record as compact JSON."""
+    # For generic records, use compact JSON
+    # Focus on content fields if available
+    if content_field and content_field in record:
+        content = record[content_field]
+        other_fields = {k: v for k, v in record.items() if k != content_field}
+        if other_fields:
+            meta = _dumps_compact(other_fields)
+            return f"{meta}\n{content}"
+        return str(content)
+    
+    return _dumps_compact(record)
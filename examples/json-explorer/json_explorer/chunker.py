@@ -7,21 +7,54 @@ Design Philosophy:
 - Provide metadata for each chunk (index, offset, context)
 """
 
+import hashlib
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Iterator, Optional, Any, Callable
 from pathlib import Path
 
 from .schema import JsonSchema, JsonFormat
 from .config import ChunkingStrategy
+from ._formatters import (
+    format_discord_message,
+    format_slack_message,
+    format_generic_record,
+)
 
+# orjson (if available) parses whole exports several times faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
 
-@dataclass
+
+# Above this many records, grouping uses pandas (if installed) instead of
+# a pure-Python dict-of-lists loop.
+VECTORIZED_GROUPING_THRESHOLD = 50_000
+
+# Below this many records, formatting stays in-process even when workers
+# are configured (process startup and pickling would dominate).
+PARALLEL_FORMAT_MIN_RECORDS = 5_000
+
+
+def _format_records_worker(args: tuple[JsonSchema, list[dict]]) -> list[str]:
+    """Format a batch of records in a worker process."""
+    schema, records = args
+    chunker = JsonChunker(schema=schema)
+    return [chunker._format_record(record) for record in records]
+
+
+@dataclass(slots=True)
 class Chunk:
     """
     A chunk of JSON data ready for LLM processing.
     
     Contains the actual data plus metadata for tracing.
+    Slotted: one instance per chunk adds up on very large exports.
     """
     index: int
     total_chunks: Optional[int] = None  # May be unknown for streaming
@@ -44,6 +77,36 @@ class Chunk:
     start_timestamp: Optional[str] = None
     end_timestamp: Optional[str] = None
     
+    # (text_content, lowercased) pair backing text_content_lower
+    _text_lower: Optional[tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def text_content_lower(self) -> str:
+        """Lowercased text_content, computed once per content string."""
+        cached = self._text_lower
+        if cached is None or cached[0] is not self.text_content:
+            # str.lower() has an ASCII fast path that beats encode().translate()
+            cached = (self.text_content, self.text_content.lower())
+            self._text_lower = cached
+        return cached[1]
+    
+    # (text_content, digest) pair backing content_digest
+    _digest: Optional[tuple[str, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def content_digest(self) -> bytes:
+        """BLAKE2 digest of the full text_content, computed once per content string."""
+        cached = self._digest
+        if cached is None or cached[0] is not self.text_content:
+            digest = hashlib.blake2b(self.text_content.encode(), digest_size=16).digest()
+            cached = (self.text_content, digest)
+            self._digest = cached
+        return cached[1]
+    
     def to_llm_context(self, include_metadata: bool = True) -> str:
         """Format chunk for LLM consumption."""
         parts = []
@@ -68,6 +131,7 @@ class Chunk:
     
     def to_dict(self) -> dict:
         """Serialize for tracing."""
+        text = self.text_content
         return {
             "index": self.index,
             "total_chunks": self.total_chunks,
@@ -80,7 +144,7 @@ class Chunk:
             "start_timestamp": self.start_timestamp,
             "end_timestamp": self.end_timestamp,
             # Don't include full content in trace metadata
-            "preview": self.text_content[:200] + "..." if len(self.text_content) > 200 else self.text_content,
+            "preview": text if len(text) <= 200 else text[:200] + "...",
         }
 
 
@@ -102,6 +166,7 @@ class JsonChunker:
         group_field: Optional[str] = None,
         records_per_chunk: int = 100,
         overlap: int = 0,  # Number of records to overlap
+        n_workers: int = 1,  # Processes for record formatting (1 = in-process)
     ):
         self.schema = schema
         self.max_chunk_size = max_chunk_size
@@ -109,12 +174,30 @@ class JsonChunker:
         self.group_field = group_field
         self.records_per_chunk = records_per_chunk
         self.overlap = overlap
+        self.n_workers = n_workers
         
         # Determine actual strategy
         if strategy == ChunkingStrategy.AUTO:
             self._auto_strategy = self._detect_strategy()
         else:
             self._auto_strategy = strategy
+        
+        # Records parsed by the last chunk_from_file(keep_records=True)
+        self._records: Optional[list[dict]] = None
+        
+        # Formatting workers, started on first use and reused across calls
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    @property
+    def parsed_records(self) -> Optional[list[dict]]:
+        """Records kept by the last chunk_from_file(..., keep_records=True) call."""
+        return self._records
+    
+    def close(self) -> None:
+        """Shut down the formatting worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
     
     def _detect_strategy(self) -> ChunkingStrategy:
         """Auto-detect best chunking strategy based on schema."""
@@ -132,27 +215,45 @@ class JsonChunker:
         
         return ChunkingStrategy.SIZE_BASED
     
-    def chunk_from_file(self, file_path: str | Path) -> Iterator[Chunk]:
+    def chunk_from_file(
+        self,
+        file_path: str | Path,
+        keep_records: bool = False,
+    ) -> Iterator[Chunk]:
         """
         Stream chunks from a JSON file.
         
         Yields Chunk objects as they are created.
         Memory efficient - doesn't load full file.
+        
+        With keep_records=True the parsed records stay available as
+        `parsed_records` (e.g. for citation verification) without a
+        second read of the file.
         """
         file_path = Path(file_path)
+        self._records = None
         
         # For now, load file (in production, use ijson for streaming)
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if HAS_ORJSON:
+            data = orjson.loads(file_path.read_bytes())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         # Handle different root types
         if isinstance(data, list):
+            if keep_records:
+                self._records = data
             yield from self._chunk_array(data)
         elif isinstance(data, dict):
             # Check for known wrapper formats
             if "messages" in data and isinstance(data["messages"], list):
+                if keep_records:
+                    self._records = data["messages"]
                 yield from self._chunk_array(data["messages"])
             else:
+                if keep_records:
+                    self._records = [data]
                 # Yield single chunk for object
                 yield self._create_chunk(
                     records=[data],
@@ -182,6 +283,9 @@ class JsonChunker:
         """Chunk by fixed number of records."""
         total_chunks = (len(records) + self.records_per_chunk - 1) // self.records_per_chunk
         
+        # Format everything up front only when it can be farmed out
+        formatted = self._format_records(records) if self.n_workers > 1 else None
+        
         start = 0
         chunk_index = 0
         
@@ -194,6 +298,7 @@ class JsonChunker:
                 index=chunk_index,
                 total=total_chunks,
                 start_idx=start,
+                text_parts=formatted[start:end] if formatted is not None else None,
             )
             
             chunk_index += 1
@@ -201,35 +306,35 @@ class JsonChunker:
     
     def _chunk_by_size(self, records: list[dict]) -> Iterator[Chunk]:
         """Chunk by character size limit."""
+        # Each record is formatted once: for sizing here and reused as chunk text
+        formatted = self._format_records(records)
+        
         chunks = []
-        current_records = []
         current_size = 0
         start_idx = 0
         
-        for i, record in enumerate(records):
-            record_str = self._format_record(record)
+        for i, record_str in enumerate(formatted):
             record_size = len(record_str)
             
-            if current_size + record_size > self.max_chunk_size and current_records:
+            if current_size + record_size > self.max_chunk_size and i > start_idx:
                 # Emit current chunk
-                chunks.append((current_records, start_idx))
-                current_records = []
+                chunks.append((start_idx, i))
                 current_size = 0
                 start_idx = i
             
-            current_records.append(record)
             current_size += record_size
         
-        if current_records:
-            chunks.append((current_records, start_idx))
+        if start_idx < len(records):
+            chunks.append((start_idx, len(records)))
         
         total = len(chunks)
-        for idx, (chunk_records, start) in enumerate(chunks):
+        for idx, (start, end) in enumerate(chunks):
             yield self._create_chunk(
-                records=chunk_records,
+                records=records[start:end],
                 index=idx,
                 total=total,
                 start_idx=start,
+                text_parts=formatted[start:end],
             )
     
     def _chunk_by_time(self, records: list[dict]) -> Iterator[Chunk]:
@@ -239,25 +344,30 @@ class JsonChunker:
             yield from self._chunk_by_records(records)
             return
         
-        # Sort by timestamp
-        sorted_records = sorted(
-            records,
-            key=lambda r: r.get(timestamp_field, "") or ""
-        )
+        groups: Optional[dict[str, list[dict]]] = None
+        if len(records) > VECTORIZED_GROUPING_THRESHOLD:
+            groups = self._group_by_day_vectorized(records, timestamp_field)
         
-        # Group by day (extract YYYY-MM-DD from timestamp)
-        groups: dict[str, list[dict]] = {}
-        for record in sorted_records:
-            ts = record.get(timestamp_field, "")
-            if ts:
-                # Try to extract date portion
-                day = ts[:10] if len(ts) >= 10 else ts
-            else:
-                day = "unknown"
+        if groups is None:
+            # Sort by timestamp
+            sorted_records = sorted(
+                records,
+                key=lambda r: r.get(timestamp_field, "") or ""
+            )
             
-            if day not in groups:
-                groups[day] = []
-            groups[day].append(record)
+            # Group by day (extract YYYY-MM-DD from timestamp)
+            groups = {}
+            for record in sorted_records:
+                ts = record.get(timestamp_field, "")
+                if ts:
+                    # Try to extract date portion (interned: few distinct days)
+                    day = sys.intern(ts[:10] if len(ts) >= 10 else ts)
+                else:
+                    day = "unknown"
+                
+                if day not in groups:
+                    groups[day] = []
+                groups[day].append(record)
         
         # Create chunks from groups (may need to split large days)
         chunk_index = 0
@@ -289,13 +399,18 @@ class JsonChunker:
             yield from self._chunk_by_records(records)
             return
         
-        # Group by field value
-        groups: dict[str, list[dict]] = {}
-        for record in records:
-            value = str(record.get(self.group_field, "unknown"))
-            if value not in groups:
-                groups[value] = []
-            groups[value].append(record)
+        groups: Optional[dict[str, list[dict]]] = None
+        if len(records) > VECTORIZED_GROUPING_THRESHOLD:
+            groups = self._group_by_field_vectorized(records)
+        
+        if groups is None:
+            # Group by field value
+            groups = {}
+            for record in records:
+                value = sys.intern(str(record.get(self.group_field, "unknown")))
+                if value not in groups:
+                    groups[value] = []
+                groups[value].append(record)
         
         chunk_index = 0
         for field_value, group_records in groups.items():
@@ -307,6 +422,70 @@ class JsonChunker:
                 yield sub_chunk
                 chunk_index += 1
     
+    def _group_by_day_vectorized(
+        self,
+        records: list[dict],
+        timestamp_field: str,
+    ) -> Optional[dict[str, list[dict]]]:
+        """
+        Group records by day using numpy for very large inputs.
+        
+        Timestamps are packed into one fixed-width unicode array, so sorting
+        and date-prefix extraction run in C instead of per-record slicing.
+        Returns None if numpy is not installed or timestamps are not short
+        strings, so the caller can fall back to the pure-Python path.
+        Records within each day are sorted by timestamp.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        
+        timestamps = np.array([r.get(timestamp_field, "") or "" for r in records])
+        if timestamps.dtype.kind != "U" or timestamps.dtype.itemsize > 30 * 4:
+            return None
+        
+        # Sorting by full timestamp also orders the YYYY-MM-DD prefixes,
+        # so each day becomes one contiguous run
+        order = np.argsort(timestamps, kind="stable")
+        days = timestamps[order].astype("<U10")
+        days[days == ""] = "unknown"
+        
+        bounds = (np.flatnonzero(days[1:] != days[:-1]) + 1).tolist()
+        starts = [0, *bounds]
+        ends = [*bounds, len(records)]
+        
+        groups: dict[str, list[dict]] = {}
+        for start, end in zip(starts, ends):
+            groups[sys.intern(str(days[start]))] = [records[i] for i in order[start:end].tolist()]
+        
+        return groups
+    
+    def _group_by_field_vectorized(
+        self,
+        records: list[dict],
+    ) -> Optional[dict[str, list[dict]]]:
+        """
+        Group records by `group_field` using pandas for very large inputs.
+        
+        Returns None if pandas is not installed. Groups keep first-seen order,
+        matching the pure-Python path.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            return None
+        
+        values = pd.Series(
+            [str(r.get(self.group_field, "unknown")) for r in records],
+            dtype=object,
+        )
+        
+        return {
+            sys.intern(value): [records[i] for i in indices]
+            for value, indices in values.groupby(values, sort=False).indices.items()
+        }
+    
     def _create_chunk(
         self,
         records: list[dict],
@@ -315,13 +494,12 @@ class JsonChunker:
         start_idx: int,
         group_key: Optional[str] = None,
         group_value: Optional[str] = None,
+        text_parts: Optional[list[str]] = None,
     ) -> Chunk:
-        """Create a Chunk object from records."""
+        """Create a Chunk object from records (and their pre-formatted text, if any)."""
         # Format records for LLM
-        text_parts = []
-        for i, record in enumerate(records):
-            formatted = self._format_record(record)
-            text_parts.append(formatted)
+        if text_parts is None:
+            text_parts = [self._format_record(record) for record in records]
         
         text_content = "\n\n".join(text_parts)
         
@@ -353,59 +531,37 @@ class JsonChunker:
             end_timestamp=end_ts,
         )
     
-    def _format_record(self, record: dict) -> str:
-        """Format a single record for LLM consumption."""
-        if self.schema.format == JsonFormat.DISCORD:
-            return self._format_discord_message(record)
-        elif self.schema.format == JsonFormat.SLACK:
-            return self._format_slack_message(record)
-        else:
-            return self._format_generic_record(record)
-    
-    def _format_discord_message(self, record: dict) -> str:
-        """Format a Discord message for readability."""
-        author = record.get("author", {})
-        if isinstance(author, dict):
-            author_name = author.get("name", author.get("username", "Unknown"))
-        else:
-            author_name = str(author)
+    def _format_records(self, records: list[dict]) -> list[str]:
+        """
+        Format many records, using a process pool when `n_workers` > 1.
         
-        timestamp = record.get("timestamp", "")
-        content = record.get("content", "")
+        Formatting is CPU-bound and independent per record, so large inputs
+        are split into batches and formatted in worker processes. The pool
+        is kept for later calls; close() shuts it down.
+        """
+        if self.n_workers <= 1 or len(records) < PARALLEL_FORMAT_MIN_RECORDS:
+            return [self._format_record(record) for record in records]
         
-        # Include attachments info
-        attachments = record.get("attachments", [])
-        attachment_str = ""
-        if attachments:
-            attachment_str = f" [+{len(attachments)} attachment(s)]"
+        batch_size = -(-len(records) // (self.n_workers * 4))
+        batches = [
+            (self.schema, records[i:i + batch_size])
+            for i in range(0, len(records), batch_size)
+        ]
         
-        # Include embeds info
-        embeds = record.get("embeds", [])
-        embed_str = ""
-        if embeds:
-            embed_str = f" [+{len(embeds)} embed(s)]"
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers)
         
-        return f"[{timestamp}] {author_name}: {content}{attachment_str}{embed_str}"
-    
-    def _format_slack_message(self, record: dict) -> str:
-        """Format a Slack message for readability."""
-        user = record.get("user", "Unknown")
-        ts = record.get("ts", "")
-        text = record.get("text", "")
+        formatted: list[str] = []
+        for batch in self._pool.map(_format_records_worker, batches):
+            formatted.extend(batch)
         
-        return f"[{ts}] {user}: {text}"
+        return formatted
     
-    def _format_generic_record(self, record: dict) -> str:
-        """Format a generic record as compact JSON."""
-        # For generic records, use compact JSON
-        # Focus on content fields if available
-        if self.schema.content_field and self.schema.content_field in record:
-            content = record[self.schema.content_field]
-            other_fields = {k: v for k, v in record.items() if k != self.schema.content_field}
-            if other_fields:
-                meta = json.dumps(other_fields, ensure_ascii=False)
-                return f"{meta}\n{content}"
-            return str(content)
-        
-        return json.dumps(record, ensure_ascii=False, indent=None)
-
+    def _format_record(self, record: dict) -> str:
+        """Format a single record for LLM consumption."""
+        if self.schema.format == JsonFormat.DISCORD:
+            return format_discord_message(record)
+        elif self.schema.format == JsonFormat.SLACK:
+            return format_slack_message(record)
+        else:
+            return format_generic_record(record, self.schema.content_field)
@@ -10,12 +10,39 @@ Design Philosophy:
 - Full context preserved for audit
 """
 
+import io
 import re
+import sys
 import json
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from typing import Optional, Any
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
+
+# orjson (if available) for fast report serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+# Citations per unit of work in CitationReport.verify
+VERIFY_BATCH_SIZE = 32
+
+
+# Patterns used by CitationExtractor, compiled once at import.
+# Finding header: "### Finding N" / "### Citation N" on its own line.
+_FINDING_HEADER_RE = re.compile(r'###\s*+(?:Finding|Citation)\s*+\d++\s*+$', re.IGNORECASE)
+_INSIGHT_RE = re.compile(r'\*\*(?:Key\s*)?Insight:\*\*\s*(.+?)(?:\n|$)')
+_TS_DATE_RE = re.compile(r'\d{4}[-/]')
+_TS_TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+
+# extract_from_response parser states
+_SCAN, _HEADER, _QUOTE, _AFTER_SOURCE = range(4)
 
 
 class Sentiment(Enum):
@@ -26,12 +53,19 @@ class Sentiment(Enum):
     MIXED = "mixed"
 
 
-@dataclass
+# Lookup tables so hot paths avoid Enum comparisons and by-value calls
+_SENTIMENT_VALUES = {s: sys.intern(s.value) for s in Sentiment}
+_SENTIMENT_BY_VALUE = {value: s for s, value in _SENTIMENT_VALUES.items()}
+_SENTIMENT_LABELS = {s: s.value.capitalize() for s in Sentiment if s is not Sentiment.NEUTRAL}
+
+
+@dataclass(slots=True)
 class Citation:
     """
     A single citable reference from the JSON data.
     
     Contains all information needed to verify the source.
+    Slotted: reports can hold thousands of citations.
     """
     # Core content
     quote: str                          # Exact text quoted
@@ -56,22 +90,30 @@ class Citation:
     key_insight: Optional[str] = None    # What this means
     relevance_score: float = 0.0         # How relevant (0-1)
     
+    # Derived: normalized quote used as the dedup key in merge_citations
+    _norm_key: str = field(init=False, repr=False, compare=False)
+    # Derived: "chunk_index.record_index", formatted once
+    _reference_id: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate and clean citation."""
-        # Clean up quote
-        self.quote = self.quote.strip()
-        if self.quote.startswith('"') and self.quote.endswith('"'):
-            self.quote = self.quote[1:-1]
+        # Clean up quote: strip whitespace, then one pair of surrounding quotes
+        quote = self.quote.strip()
+        if len(quote) >= 2 and quote[0] == quote[-1] == '"':
+            quote = quote[1:-1]
+        self.quote = quote
+        self._norm_key = quote.casefold()[:100]
+        self._reference_id = f"{self.chunk_index}.{self.record_index}"
     
     @property
     def reference_id(self) -> str:
         """
-        Generate a unique reference ID for this citation.
+        Unique reference ID for this citation (formatted at construction).
         
         Format: chunk_index.record_index (e.g., "3.15")
         This can be used to look up the original record.
         """
-        return f"{self.chunk_index}.{self.record_index}"
+        return self._reference_id
     
     @property 
     def source_line(self) -> str:
@@ -94,8 +136,9 @@ class Citation:
             f"**Ref:** `{self.reference_id}`",
         ]
         
-        if self.sentiment != Sentiment.NEUTRAL:
-            lines.append(f"**Sentiment:** {self.sentiment.value.capitalize()}")
+        sentiment_label = _SENTIMENT_LABELS.get(self.sentiment)
+        if sentiment_label:
+            lines.append(f"**Sentiment:** {sentiment_label}")
         
         if self.key_insight:
             lines.append(f"**Insight:** {self.key_insight}")
@@ -112,26 +155,16 @@ class Citation:
     
     def to_dict(self) -> dict:
         """Serialize for storage/tracing."""
-        return {
-            "quote": self.quote,
-            "author": self.author,
-            "timestamp": self.timestamp,
-            "channel": self.channel,
-            "message_id": self.message_id,
-            "chunk_index": self.chunk_index,
-            "record_index": self.record_index,
-            "file_path": self.file_path,
-            "context_before": self.context_before,
-            "context_after": self.context_after,
-            "sentiment": self.sentiment.value,
-            "key_insight": self.key_insight,
-            "relevance_score": self.relevance_score,
-            "reference_id": self.reference_id,
-        }
+        data = {name: getattr(self, name) for name in _CITATION_FIELDS}
+        data["sentiment"] = _SENTIMENT_VALUES[self.sentiment]
+        data["reference_id"] = self.reference_id
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> "Citation":
         """Deserialize from storage."""
+        # Table lookup; Sentiment() only runs to raise on unknown values
+        sentiment = data.get("sentiment", "neutral")
         return cls(
             quote=data["quote"],
             author=data.get("author"),
@@ -143,12 +176,58 @@ class Citation:
             file_path=data.get("file_path"),
             context_before=data.get("context_before"),
             context_after=data.get("context_after"),
-            sentiment=Sentiment(data.get("sentiment", "neutral")),
+            sentiment=_SENTIMENT_BY_VALUE.get(sentiment) or Sentiment(sentiment),
             key_insight=data.get("key_insight"),
             relevance_score=data.get("relevance_score", 0.0),
         )
 
 
+# Serialized Citation fields, in declaration order (derived fields excluded)
+_CITATION_FIELDS = tuple(f.name for f in fields(Citation) if f.init)
+
+
+def _verify_batch(
+    citations: list[Citation],
+    record_words: dict[int, frozenset[str]],
+) -> tuple[int, list[str]]:
+    """
+    Verify a batch of citations against the records they reference.
+    
+    `record_words` maps record index to the record's lowercased word set
+    for every in-range reference; a missing index means out of range.
+    
+    Returns:
+        (verified count, issues)
+    """
+    verified_count = 0
+    issues = []
+    
+    for citation in citations:
+        # Only record_index can be checked against flat data
+        content_words = record_words.get(citation.record_index)
+        
+        if content_words is None:
+            issues.append(
+                f"Ref {citation.reference_id}: Record index out of range"
+            )
+            continue
+        
+        # Check if quote exists in content (fuzzy match)
+        quote_words = frozenset(citation.quote.lower().split())
+        
+        # At least 50% word overlap; integer form of hits / len > 0.5,
+        # also false for an empty quote
+        hits = len(quote_words & content_words)
+        if 2 * hits > len(quote_words):
+            verified_count += 1
+        else:
+            issues.append(
+                f"Ref {citation.reference_id}: Quote not found in record"
+            )
+    
+    return verified_count, issues
+
+
 @dataclass
 class CitationReport:
     """
@@ -171,32 +250,63 @@ class CitationReport:
     verified: bool = False
     verification_issues: list[str] = field(default_factory=list)
     
-    # Metadata
-    generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Metadata (None = taken when the report is first rendered)
+    generated_at: Optional[str] = None
+    
+    # Running stats state (how many citations the stats reflect)
+    _authors: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _stats_count: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def _timestamp(self) -> str:
+        """generated_at, filled in on first use if it wasn't given."""
+        if self.generated_at is None:
+            self.generated_at = datetime.now().isoformat()
+        return self.generated_at
     
     def add_citation(self, citation: Citation):
         """Add a citation to the report."""
         self.citations.append(citation)
         self.total_found = len(self.citations)
-        self._update_stats()
+        
+        if self._stats_count and self._stats_count == self.total_found - 1:
+            # Stats are current: fold in just the new citation
+            self._count_citation(citation)
+        else:
+            # First insert, or citations were modified directly
+            self._update_stats()
     
     def _update_stats(self):
-        """Update summary statistics."""
-        authors = set(c.author for c in self.citations if c.author)
-        self.unique_authors = len(authors)
-        
-        self.sentiment_breakdown = {
-            "positive": len([c for c in self.citations if c.sentiment == Sentiment.POSITIVE]),
-            "negative": len([c for c in self.citations if c.sentiment == Sentiment.NEGATIVE]),
-            "neutral": len([c for c in self.citations if c.sentiment == Sentiment.NEUTRAL]),
-            "mixed": len([c for c in self.citations if c.sentiment == Sentiment.MIXED]),
-        }
+        """Recompute summary statistics from scratch."""
+        # map/attrgetter, set and Counter run in C. Sentiments are counted by
+        # their _value_ string: hashing the Enum members would call the
+        # Python-level Enum.__hash__ (and .value a Python property) per citation.
+        self._authors = set(map(attrgetter("author"), self.citations))
+        self._authors.discard(None)
+        self._authors.discard("")
+        self.unique_authors = len(self._authors)
+        
+        sentiments = Counter(map(attrgetter("sentiment._value_"), self.citations))
+        self.sentiment_breakdown = {value: sentiments[value] for value in _SENTIMENT_VALUES.values()}
+        
+        self._stats_count = len(self.citations)
+    
+    def _count_citation(self, citation: Citation):
+        """Fold one citation into the running statistics."""
+        if citation.author:
+            self._authors.add(citation.author)
+            self.unique_authors = len(self._authors)
+        self.sentiment_breakdown[_SENTIMENT_VALUES[citation.sentiment]] += 1
+        self._stats_count += 1
     
     def get_all_references(self) -> list[str]:
         """Get list of all reference IDs for verification."""
         return [c.reference_id for c in self.citations]
     
-    def verify(self, data: list[dict], content_field: str = "content") -> bool:
+    def verify(
+        self,
+        data: list[dict],
+        content_field: str = "content",
+    ) -> bool:
         """
         Verify citations against original data.
         
@@ -207,107 +317,96 @@ class CitationReport:
         Returns:
             True if all citations verified
         """
+        # For now we can only verify record_idx against flat data
+        # Chunk index would need the chunker to verify
+        batches = [
+            self.citations[i:i + VERIFY_BATCH_SIZE]
+            for i in range(0, len(self.citations), VERIFY_BATCH_SIZE)
+        ]
+        # Tokenize each referenced record once, however many citations
+        # point at it (many findings often come from the same message)
+        record_words: dict[int, frozenset[str]] = {}
+        for citation in self.citations:
+            idx = citation.record_index
+            if idx not in record_words and -len(data) <= idx < len(data):
+                record = data[idx]
+                content = record.get(content_field, str(record))
+                record_words[idx] = frozenset(content.lower().split())
+        
         self.verification_issues = []
         verified_count = 0
-        
-        for citation in self.citations:
-            try:
-                # Parse reference
-                chunk_idx, record_idx = map(int, citation.reference_id.split("."))
-                
-                # For now we can only verify record_idx against flat data
-                # Chunk index would need the chunker to verify
-                if record_idx < len(data):
-                    record = data[record_idx]
-                    content = record.get(content_field, str(record))
-                    
-                    # Check if quote exists in content (fuzzy match)
-                    quote_words = set(citation.quote.lower().split())
-                    content_words = set(content.lower().split())
-                    
-                    overlap = len(quote_words & content_words) / len(quote_words) if quote_words else 0
-                    
-                    if overlap > 0.5:  # At least 50% word overlap
-                        verified_count += 1
-                    else:
-                        self.verification_issues.append(
-                            f"Ref {citation.reference_id}: Quote not found in record"
-                        )
-                else:
-                    self.verification_issues.append(
-                        f"Ref {citation.reference_id}: Record index out of range"
-                    )
-                    
-            except (ValueError, IndexError) as e:
-                self.verification_issues.append(
-                    f"Ref {citation.reference_id}: Verification error - {e}"
-                )
+        for batch in batches:
+            batch_verified, batch_issues = _verify_batch(batch, record_words)
+            verified_count += batch_verified
+            self.verification_issues.extend(batch_issues)
         
         self.verified = verified_count == len(self.citations)
         return self.verified
     
     def to_markdown(self) -> str:
         """Generate full markdown report."""
-        lines = [
-            f"# 📚 Citation Report",
-            "",
-            f"**Query:** {self.query}",
-            f"**Source:** `{self.file_path or 'Unknown'}`",
-            f"**Generated:** {self.generated_at}",
-            "",
-            "---",
-            "",
-            "## 📊 Summary Statistics",
-            "",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Total Citations | {self.total_found} |",
-            f"| Unique Contributors | {self.unique_authors} |",
-            f"| ✅ Positive | {self.sentiment_breakdown.get('positive', 0)} |",
-            f"| ❌ Negative | {self.sentiment_breakdown.get('negative', 0)} |",
-            f"| ➖ Neutral | {self.sentiment_breakdown.get('neutral', 0)} |",
-            f"| 🔄 Mixed | {self.sentiment_breakdown.get('mixed', 0)} |",
-            "",
-            "---",
-            "",
-            "## 🔍 All Citations",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        
+        w(
+            f"# 📚 Citation Report\n"
+            f"\n"
+            f"**Query:** {self.query}\n"
+            f"**Source:** `{self.file_path or 'Unknown'}`\n"
+            f"**Generated:** {self._timestamp()}\n"
+            f"\n"
+            f"---\n"
+            f"\n"
+            f"## 📊 Summary Statistics\n"
+            f"\n"
+            f"| Metric | Value |\n"
+            f"|--------|-------|\n"
+            f"| Total Citations | {self.total_found} |\n"
+            f"| Unique Contributors | {self.unique_authors} |\n"
+            f"| ✅ Positive | {self.sentiment_breakdown.get('positive', 0)} |\n"
+            f"| ❌ Negative | {self.sentiment_breakdown.get('negative', 0)} |\n"
+            f"| ➖ Neutral | {self.sentiment_breakdown.get('neutral', 0)} |\n"
+            f"| 🔄 Mixed | {self.sentiment_breakdown.get('mixed', 0)} |\n"
+            f"\n"
+            f"---\n"
+            f"\n"
+            f"## 🔍 All Citations\n"
+            f"\n"
+        )
         
         for i, citation in enumerate(self.citations, 1):
-            lines.append(f"### Citation {i}")
-            lines.append("")
-            lines.append(citation.to_markdown())
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            w(f"### Citation {i}\n\n")
+            w(citation.to_markdown())
+            w("\n\n---\n\n")
         
         # Verification section
-        lines.extend([
-            "## ✅ Verification",
-            "",
-            f"**Status:** {'Verified ✓' if self.verified else 'Not Verified'}",
-            "",
-        ])
+        w(
+            f"## ✅ Verification\n"
+            f"\n"
+            f"**Status:** {'Verified ✓' if self.verified else 'Not Verified'}\n"
+            f"\n"
+        )
         
         if self.verification_issues:
-            lines.append("**Issues:**")
+            w("**Issues:**\n")
             for issue in self.verification_issues:
-                lines.append(f"- ⚠️ {issue}")
-            lines.append("")
+                w(f"- ⚠️ {issue}\n")
+            w("\n")
         
         # Reference list
-        lines.extend([
-            "## 🔗 Reference Index",
-            "",
-            "Use these references to look up original records:",
-            "",
-        ])
+        w(
+            "## 🔗 Reference Index\n"
+            "\n"
+            "Use these references to look up original records:\n"
+            "\n"
+        )
         
         for ref in self.get_all_references():
-            lines.append(f"- `{ref}`")
+            w(f"- `{ref}`\n")
         
-        return "\n".join(lines)
+        # Lines were newline-terminated; the report has no trailing newline
+        text = buf.getvalue()
+        return text[:-1] if text.endswith("\n") else text
     
     def to_dict(self) -> dict:
         """Serialize for storage."""
@@ -320,8 +419,27 @@ class CitationReport:
             "sentiment_breakdown": self.sentiment_breakdown,
             "verified": self.verified,
             "verification_issues": self.verification_issues,
-            "generated_at": self.generated_at,
+            "generated_at": self._timestamp(),
         }
+    
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """
+        Serialize to UTF-8 encoded JSON.
+        
+        Uses orjson's C serializer when installed (output is already bytes,
+        no separate encode step); falls back to the stdlib with the same
+        compact or 2-space layout.
+        """
+        data = self.to_dict()
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+            except TypeError:
+                # Non-str keys, oversized ints, etc. - stdlib handles these
+                pass
+        if indent:
+            return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 class CitationExtractor:
@@ -352,67 +470,64 @@ class CitationExtractor:
         """
         citations = []
         
-        # Pattern to match citation blocks
-        # Look for ### Finding N or ### Citation N followed by blockquote
-        finding_pattern = r'###\s*(?:Finding|Citation)\s*\d+\s*\n+>\s*["\']?(.+?)["\']?\s*\n+\*\*Source:\*\*\s*(.+?)\n'
-        
-        matches = re.finditer(finding_pattern, response, re.DOTALL | re.IGNORECASE)
+        # Single pass over the lines: "### Finding N" header, blank lines,
+        # a blockquote (possibly multi-line), a **Source:** line, then
+        # insight/sentiment text up to the next "###" header.
+        state = _SCAN
+        quote_lines: list[str] = []
+        source_line = ""
+        section: list[str] = []
+        key_insight = None
         
-        record_idx = 0
-        for match in matches:
-            quote = match.group(1).strip().strip('"\'')
-            source_line = match.group(2).strip()
-            
-            # Parse source line (format: @username | timestamp | channel)
-            source_parts = [p.strip() for p in source_line.split("|")]
-            
-            author = None
-            timestamp = None
-            channel = None
-            
-            for part in source_parts:
-                if part.startswith("@"):
-                    author = part[1:]
-                elif "#" in part:
-                    channel = part.replace("#", "").strip()
-                elif re.match(r'\d{4}[-/]', part) or re.match(r'\d{1,2}:\d{2}', part):
-                    timestamp = part
-            
-            # Look for sentiment in surrounding text
-            sentiment = Sentiment.NEUTRAL
-            text_after = response[match.end():match.end() + 200].lower()
-            if "positive" in text_after:
-                sentiment = Sentiment.POSITIVE
-            elif "negative" in text_after:
-                sentiment = Sentiment.NEGATIVE
-            elif "mixed" in text_after:
-                sentiment = Sentiment.MIXED
-            
-            # Look for insight
-            insight_match = re.search(r'\*\*(?:Key\s*)?Insight:\*\*\s*(.+?)(?:\n|$)', 
-                                      response[match.end():match.end() + 500])
-            key_insight = insight_match.group(1).strip() if insight_match else None
-            
-            citation = Citation(
-                quote=quote,
-                author=author,
-                timestamp=timestamp,
-                channel=channel,
-                chunk_index=chunk_index,
-                record_index=record_idx,
-                file_path=file_path,
-                sentiment=sentiment,
-                key_insight=key_insight,
-            )
+        for line in response.splitlines():
+            if state == _AFTER_SOURCE:
+                if "###" not in line or not _FINDING_HEADER_RE.search(line):
+                    if key_insight is None and "Insight:**" in line:
+                        insight_match = _INSIGHT_RE.search(line)
+                        if insight_match:
+                            key_insight = insight_match.group(1).strip()
+                    section.append(line.lower())
+                    continue
+                citations.append(CitationExtractor._build_citation(
+                    quote_lines, source_line, section, key_insight,
+                    chunk_index, len(citations), file_path,
+                ))
+                state = _SCAN
+            elif state == _HEADER:
+                if line.startswith(">"):
+                    quote_lines = [line[1:]]
+                    state = _QUOTE
+                    continue
+                if not line.strip():
+                    continue
+                state = _SCAN
+            elif state == _QUOTE:
+                if line[:11].lower() == "**source:**":
+                    source_line = line[11:].strip()
+                    section = []
+                    key_insight = None
+                    state = _AFTER_SOURCE
+                else:
+                    quote_lines.append(line)
+                continue
             
-            citations.append(citation)
-            record_idx += 1
+            if "###" in line and _FINDING_HEADER_RE.search(line):
+                state = _HEADER
+        
+        if state == _AFTER_SOURCE:
+            citations.append(CitationExtractor._build_citation(
+                quote_lines, source_line, section, key_insight,
+                chunk_index, len(citations), file_path,
+            ))
         
         # Fallback: try to extract simple blockquotes if structured format not found
         if not citations:
-            blockquote_pattern = r'>\s*["\']?(.+?)["\']?\s*\n'
-            for i, match in enumerate(re.finditer(blockquote_pattern, response)):
-                quote = match.group(1).strip()
+            quote_lines = (
+                line.lstrip() for line in response.splitlines()
+            )
+            blockquotes = (line for line in quote_lines if line.startswith(">"))
+            for i, line in enumerate(blockquotes):
+                quote = line[1:].strip().strip('"\'')
                 if len(quote) > 10:  # Skip very short quotes
                     citations.append(Citation(
                         quote=quote,
@@ -423,6 +538,55 @@ class CitationExtractor:
         
         return citations
     
+    @staticmethod
+    def _build_citation(
+        quote_lines: list[str],
+        source_line: str,
+        section: list[str],
+        key_insight: Optional[str],
+        chunk_index: int,
+        record_index: int,
+        file_path: Optional[str],
+    ) -> Citation:
+        """Build a Citation from the pieces collected for one finding."""
+        quote = "\n".join(quote_lines).strip().strip('"\'')
+        
+        # Parse source line (format: @username | timestamp | channel)
+        author = None
+        timestamp = None
+        channel = None
+        
+        for part in source_line.split("|"):
+            part = part.strip()
+            if part.startswith("@"):
+                author = part[1:]
+            elif "#" in part:
+                channel = part.replace("#", "").strip()
+            elif _TS_DATE_RE.match(part) or _TS_TIME_RE.match(part):
+                timestamp = part
+        
+        # Look for sentiment in the text following the source line
+        text_after = "\n".join(section)
+        sentiment = Sentiment.NEUTRAL
+        if "positive" in text_after:
+            sentiment = Sentiment.POSITIVE
+        elif "negative" in text_after:
+            sentiment = Sentiment.NEGATIVE
+        elif "mixed" in text_after:
+            sentiment = Sentiment.MIXED
+        
+        return Citation(
+            quote=quote,
+            author=author,
+            timestamp=timestamp,
+            channel=channel,
+            chunk_index=chunk_index,
+            record_index=record_index,
+            file_path=file_path,
+            sentiment=sentiment,
+            key_insight=key_insight,
+        )
+    
     @staticmethod
     def merge_citations(
         chunk_citations: list[list[Citation]],
@@ -438,22 +602,20 @@ class CitationExtractor:
         Returns:
             Merged list of citations
         """
-        all_citations = []
-        seen_quotes = set()
-        
-        for citations in chunk_citations:
-            for citation in citations:
-                # Deduplicate by quote text (normalized)
-                quote_key = citation.quote.lower().strip()[:100]
-                
-                if deduplicate and quote_key in seen_quotes:
-                    continue
-                
-                seen_quotes.add(quote_key)
-                all_citations.append(citation)
+        if deduplicate:
+            # Deduplicate by quote text (normalized at construction).
+            # First occurrence wins; the dict keeps insertion order.
+            merged: dict[str, Citation] = {}
+            for citations in chunk_citations:
+                for citation in citations:
+                    merged.setdefault(citation._norm_key, citation)
+            all_citations = list(merged.values())
+        else:
+            all_citations = [c for citations in chunk_citations for c in citations]
         
         # Sort by chunk/record index for consistent ordering
-        all_citations.sort(key=lambda c: (c.chunk_index, c.record_index))
+        # (near-linear: per-chunk lists arrive as already-sorted runs)
+        all_citations.sort(key=attrgetter("chunk_index", "record_index"))
         
         return all_citations
 
@@ -15,8 +15,9 @@ Supports:
 - Cloudflare R2 for file storage
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from collections.abc import Callable, Iterator, Mapping
 from typing import Optional, Literal
 
 
@@ -61,15 +62,23 @@ class ExplorerConfig:
         
         max_chunk_size: Maximum characters per chunk sent to LLM
         max_chunks_per_query: Limit on chunks processed per query
-        max_tokens_budget: Total token budget for a query
+        max_tokens_budget: Total token budget for a query (each chunk call is estimated
+            against it before sending, real-time and batch-API alike)
         timeout_seconds: Timeout for LLM calls
         
         parallel_chunks: Number of chunks to process in parallel
+        requests_per_minute: Cap on LLM calls per minute (None = no pacing)
+        llm_batch_size: Small chunks sent together in one LLM call (1 = off)
+        use_batch_api: Send chunk calls as a provider batch job (half price, up to 24h)
         enable_caching: Cache chunk results for repeated queries
         cache_ttl_seconds: Cache time-to-live
+        cache_max_entries: Chunk results kept before least recently used are evicted
+        cache_path: SQLite file sharing chunk results across processes (None = in-memory only)
+        cache_namespace: Scope for shared cache entries (e.g. per user or project)
         
         chunking_strategy: How to chunk the data
         chunk_overlap: Characters of overlap between chunks
+        format_workers: Processes for formatting records into chunks (1 = in-process)
         
         trace_level: Level of execution tracing
         trace_output_dir: Directory to save traces (None = don't save)
@@ -110,12 +119,19 @@ class ExplorerConfig:
     
     # Parallelism and caching
     parallel_chunks: int = 4
+    requests_per_minute: Optional[int] = None  # Stay under provider rate limits
+    llm_batch_size: int = 1  # Chunks per LLM call; batches stay within max_chunk_size
+    use_batch_api: bool = False  # For scheduled, non-interactive runs
     enable_caching: bool = True
     cache_ttl_seconds: int = 3600  # 1 hour
+    cache_max_entries: int = 10_000
+    cache_path: Optional[str] = None  # e.g. ~/.cache/json-explorer/chunks.sqlite3
+    cache_namespace: str = ""
     
     # Chunking configuration
     chunking_strategy: ChunkingStrategy = ChunkingStrategy.AUTO
     chunk_overlap: int = 500  # Characters of overlap
+    format_workers: int = 1  # >1 only pays off on very large exports
     
     # Tracing and debugging
     trace_level: TraceLevel = TraceLevel.FULL
@@ -145,7 +161,7 @@ class ExplorerConfig:
     
     # MCP configuration
     mcp_server_url: Optional[str] = None  # URL for MCP server
-    mcp_headers: dict = field(default_factory=dict)  # Headers for MCP requests
+    mcp_headers: Optional[dict] = None  # Headers for MCP requests
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -155,36 +171,45 @@ class ExplorerConfig:
             raise ValueError("max_chunks_per_query must be at least 1")
         if self.parallel_chunks < 1:
             raise ValueError("parallel_chunks must be at least 1")
+        if self.llm_batch_size < 1:
+            raise ValueError("llm_batch_size must be at least 1")
+        if self.requests_per_minute is not None and self.requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if self.cache_max_entries < 1:
+            raise ValueError("cache_max_entries must be at least 1")
+        if self.format_workers < 1:
+            raise ValueError("format_workers must be at least 1")
 
 
-# Preset configurations for common use cases
-PRESETS = {
-    "fast": ExplorerConfig(
+# Preset configurations for common use cases.
+# Factories, so importing the module doesn't build every config up front.
+_PRESET_FACTORIES: dict[str, Callable[[], ExplorerConfig]] = {
+    "fast": lambda: ExplorerConfig(
         model="claude-3-haiku-20240307",
         max_chunk_size=30_000,
         parallel_chunks=8,
         trace_level=TraceLevel.MINIMAL,
     ),
-    "balanced": ExplorerConfig(
+    "balanced": lambda: ExplorerConfig(
         model="claude-3-haiku-20240307",
         max_chunk_size=50_000,
         parallel_chunks=4,
         trace_level=TraceLevel.SUMMARY,
     ),
-    "thorough": ExplorerConfig(
+    "thorough": lambda: ExplorerConfig(
         model="claude-sonnet-4-20250514",
         max_chunk_size=100_000,
         parallel_chunks=2,
         trace_level=TraceLevel.FULL,
     ),
-    "budget": ExplorerConfig(
+    "budget": lambda: ExplorerConfig(
         model="claude-3-haiku-20240307",
         max_tokens_budget=50_000,
         max_chunks_per_query=50,
         parallel_chunks=2,
     ),
     # Z.AI presets (uses GLM models via Claude API)
-    "zai_fast": ExplorerConfig(
+    "zai_fast": lambda: ExplorerConfig(
         model="glm-4.5-air",  # Maps to Claude Haiku
         adapter_type=AdapterType.ZAI,
         base_url="https://api.z.ai/api/anthropic",
@@ -192,7 +217,7 @@ PRESETS = {
         parallel_chunks=8,
         trace_level=TraceLevel.MINIMAL,
     ),
-    "zai_thorough": ExplorerConfig(
+    "zai_thorough": lambda: ExplorerConfig(
         model="glm-4.7",  # Maps to Claude Sonnet/Opus
         adapter_type=AdapterType.ZAI,
         base_url="https://api.z.ai/api/anthropic",
@@ -201,7 +226,7 @@ PRESETS = {
         trace_level=TraceLevel.FULL,
     ),
     # Production preset with Neon + R2
-    "production": ExplorerConfig(
+    "production": lambda: ExplorerConfig(
         model="claude-3-haiku-20240307",
         use_neon=True,
         use_r2=True,
@@ -210,13 +235,13 @@ PRESETS = {
         trace_level=TraceLevel.FULL,
     ),
     # Claude Code CLI preset
-    "claude_code": ExplorerConfig(
+    "claude_code": lambda: ExplorerConfig(
         adapter_type=AdapterType.CLAUDE_CODE,
         model="claude-code-cli",
         timeout_seconds=300,  # 5 minutes for complex queries
     ),
     # Codex CLI preset
-    "codex": ExplorerConfig(
+    "codex": lambda: ExplorerConfig(
         adapter_type=AdapterType.CODEX,
         model="gpt-5",
         sandbox_mode="read-only",
@@ -225,9 +250,30 @@ PRESETS = {
 }
 
 
+class _LazyPresets(Mapping):
+    """Read-only preset mapping that builds each config on first access."""
+    
+    def __init__(self, factories: dict[str, Callable[[], ExplorerConfig]]):
+        self._factories = factories
+        self._built: dict[str, ExplorerConfig] = {}
+    
+    def __getitem__(self, name: str) -> ExplorerConfig:
+        if name not in self._built:
+            self._built[name] = self._factories[name]()
+        return self._built[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories)
+
+
+PRESETS: Mapping[str, ExplorerConfig] = _LazyPresets(_PRESET_FACTORIES)
+
+
 def get_preset(name: str) -> ExplorerConfig:
     """Get a preset configuration by name."""
     if name not in PRESETS:
         raise ValueError(f"Unknown preset: {name}. Available: {list(PRESETS.keys())}")
     return PRESETS[name]
-
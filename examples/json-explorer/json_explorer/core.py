@@ -10,24 +10,79 @@ Design Philosophy:
 - Full trace for auditability
 """
 
+import os
 import re
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from queue import Empty, Queue
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Iterator
+from collections.abc import Callable
 from datetime import datetime
 
 from .config import ExplorerConfig, TraceLevel
-from .schema import SchemaAnalyzer, JsonSchema
+from .schema import SchemaAnalyzer, JsonSchema, JsonFormat
 from .chunker import JsonChunker, Chunk
 from .query_planner import QueryPlanner, QueryPlan, QueryIntent
-from .executor import ChunkExecutor, ExecutionResult, LLMClient
+from .executor import ChunkExecutor, ExecutionResult, LLMClient, keyword_matcher
 from .aggregator import ResultAggregator
 from .trace import ExecutionTrace, TraceContext, TraceEventType
 from .citation import Citation, CitationReport, CitationExtractor, Sentiment
 
+# ijson (if available) lets get_sample read only the first records of a file
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None
 
-@dataclass
+
+# Patterns used when verifying and post-processing answers
+_QUOTE_RE = re.compile(r'>\s*"?(.+?)"?\s*\n')
+_REF_RE = re.compile(r'\[\d+\.\d+\]|\[ref:\s*\d+\]|\[chunk\s*\d+\]', re.IGNORECASE)
+_WHO_RE = re.compile(r'@\w+|\w+\s+said')
+# Substring match, like the `in` checks it replaces ("all" also hits "overall")
+_EXHAUSTIVE_WORDS_RE = re.compile(r'all|every|exhaustive|complete')
+_BLANKLINES_RE = re.compile(r'\n{3,}')
+
+# Buffer size for report files
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Marks the end of stream_query's progress queue
+_STREAM_DONE = object()
+
+# Plans kept per loaded schema, keyed by query text
+PLAN_CACHE_SIZE = 128
+
+# Verification summary appended to answers (filled from VerificationResult.to_dict())
+_VERIFICATION_TEMPLATE = """
+
+---
+
+## 🔍 Verification Summary
+
+| Metric | Value |
+|--------|-------|
+| Citations found | {citations_found} |
+| Unique contributors | {unique_authors} |
+| Positive mentions | {positive_mentions} |
+| Negative mentions | {negative_mentions} |
+| Neutral mentions | {neutral_mentions} |
+"""
+
+
+@lru_cache(maxsize=256)
+def _resolve_path(path: str) -> str:
+    """Resolve an absolute path (following symlinks), memoized across loads."""
+    return str(Path(path).resolve())
+
+
+@dataclass(slots=True)
 class VerificationResult:
     """
     Verification info for an answer, similar to textbook-qa.
@@ -64,7 +119,7 @@ class VerificationResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """
     Complete result from a query.
@@ -198,6 +253,13 @@ class JsonExplorer:
         self._planner: Optional[QueryPlanner] = None
         self._executor: Optional[ChunkExecutor] = None
         self._aggregator: Optional[ResultAggregator] = None
+        
+        # Recently planned queries (plans depend only on query + schema)
+        self._plan_cache: OrderedDict[str, QueryPlan] = OrderedDict()
+        
+        # Trace/report files are written on a background thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_writes: list[Future] = []
     
     @property
     def schema(self) -> Optional[JsonSchema]:
@@ -221,69 +283,83 @@ class JsonExplorer:
         Returns:
             JsonSchema with structure information
         """
-        file_path = str(Path(file_path).resolve())
+        file_path = _resolve_path(os.path.join(os.getcwd(), file_path))
         self._file_path = file_path
         
         # Analyze schema
-        analyzer = SchemaAnalyzer(
+        self._schema = self._schema_analyzer().analyze(file_path)
+        
+        self._init_components()
+        
+        return self._schema
+    
+    def load_data(self, data: list[dict], name: str = "inline_data") -> JsonSchema:
+        """
+        Load JSON data directly (not from file).
+        
+        Args:
+            data: List of dictionaries
+            name: Name for tracing
+            
+        Returns:
+            JsonSchema with structure information
+        """
+        # Analyze the records in place rather than round-tripping through a file
+        self._schema = self._schema_analyzer().analyze_data(data)
+        
+        # Cache the data since it's already in memory
+        self._data = data
+        self._file_path = name  # Used for display
+        
+        self._init_components()
+        
+        return self._schema
+    
+    def _schema_analyzer(self) -> SchemaAnalyzer:
+        """Create a schema analyzer from the current config."""
+        return SchemaAnalyzer(
             sample_size=self.config.schema_sample_size,
             max_depth=self.config.schema_max_depth,
         )
-        self._schema = analyzer.analyze(file_path)
+    
+    def _init_components(self):
+        """Initialize chunker, planner, executor and aggregator for the loaded schema."""
+        self._plan_cache.clear()
         
-        # Initialize components
+        if self._chunker is not None:
+            self._chunker.close()
         self._chunker = JsonChunker(
             schema=self._schema,
             max_chunk_size=self.config.max_chunk_size,
             strategy=self.config.chunking_strategy,
+            n_workers=self.config.format_workers,
         )
         
-        self._planner = QueryPlanner(schema=self._schema)
+        self._planner = QueryPlanner(
+            schema=self._schema,
+            batch_ok=self.config.use_batch_api,
+        )
         
+        if self._executor is not None:
+            self._executor.close()
         self._executor = ChunkExecutor(
             llm_client=self.llm,
             schema=self._schema,
             max_parallel=self.config.parallel_chunks,
             cache_enabled=self.config.enable_caching,
             max_tokens_budget=self.config.max_tokens_budget,
+            batch_size=self.config.llm_batch_size,
+            max_batch_chars=self.config.max_chunk_size,
+            cache_max_entries=self.config.cache_max_entries,
+            cache_ttl_seconds=self.config.cache_ttl_seconds,
+            cache_path=self.config.cache_path and os.path.expanduser(self.config.cache_path),
+            cache_namespace=self.config.cache_namespace,
+            requests_per_minute=self.config.requests_per_minute,
         )
         
         self._aggregator = ResultAggregator(
             llm_client=self.llm,
         )
-        
-        return self._schema
-    
-    def load_data(self, data: list[dict], name: str = "inline_data") -> JsonSchema:
-        """
-        Load JSON data directly (not from file).
-        
-        Args:
-            data: List of dictionaries
-            name: Name for tracing
-            
-        Returns:
-            JsonSchema with structure information
-        """
-        import json
-        import tempfile
-        
-        # Write to temp file for schema analysis
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.json',
-            delete=False
-        ) as f:
-            json.dump(data, f)
-            temp_path = f.name
-        
-        schema = self.load(temp_path)
-        
-        # Cache the data since it's already in memory
-        self._data = data
-        self._file_path = name  # Override for display
-        
-        return schema
     
     def analyze_schema(self) -> str:
         """
@@ -308,7 +384,8 @@ class JsonExplorer:
         
         Args:
             query: Natural language question
-            save_trace: Whether to save execution trace to file
+            save_trace: Whether to save execution trace to file (written in
+                the background; call flush() to wait for it)
             trace_dir: Directory for trace files (uses config if not specified)
             
         Returns:
@@ -332,7 +409,7 @@ class JsonExplorer:
                     "Planning query execution",
                 )
                 
-                plan = self._planner.plan(query)
+                plan = self._plan(query)
                 
                 trace.add_entry(
                     TraceEventType.PLAN_END,
@@ -340,20 +417,20 @@ class JsonExplorer:
                     data=plan.to_dict(),
                 )
                 
-                # Phase 2: Get chunks
-                if self._data:
-                    chunks = list(self._chunker.chunk_from_data(self._data))
-                else:
-                    chunks = list(self._chunker.chunk_from_file(self._file_path))
+                # Phase 2-3: Stream chunks straight into execution.
+                # Exhaustive queries on a file keep the records parsed for
+                # chunking so citations can be verified without a second read.
+                keep_records = not self._data and plan.intent == QueryIntent.EXHAUSTIVE_EXTRACT
+                exec_result = self._executor.execute(
+                    self._iter_chunks(keep_records=keep_records), plan, trace,
+                )
+                verify_data = self._chunker.parsed_records if keep_records else None
                 
                 trace.add_entry(
                     TraceEventType.INFO,
-                    f"Created {len(chunks)} chunks from data",
+                    f"Streamed {exec_result.total_chunks} chunks from data",
                 )
                 
-                # Phase 3: Execute
-                exec_result = self._executor.execute(chunks, plan, trace)
-                
                 # Phase 4: Final aggregation (if not done in executor)
                 if exec_result.aggregated_content:
                     answer = exec_result.aggregated_content
@@ -377,6 +454,7 @@ class JsonExplorer:
                         answer=answer,
                         chunk_results=exec_result.chunk_results,
                         trace=trace,
+                        verify_data=verify_data,
                     )
                 else:
                     # Basic verification for all queries
@@ -416,39 +494,66 @@ class JsonExplorer:
                     trace=trace,
                 )
         
-        # Save trace if requested
+        # Save trace if requested (off the caller's thread)
         if save_trace:
             trace_output = trace_dir or self.config.trace_output_dir or "./traces"
-            result.trace.save(trace_output)
+            self._submit_write(result.trace.save, trace_output)
             
             # Also save citation report for exhaustive queries
             if result.citation_report:
-                self._save_citation_report(result.citation_report, trace_output)
+                self._submit_write(
+                    self._save_citation_report, result.citation_report, trace_output
+                )
         
         return result
     
+    def _submit_write(self, fn: Callable, *args):
+        """Queue a file write on the background I/O thread."""
+        # Drop finished writes, keeping failures for flush() to report
+        self._pending_writes = [
+            f for f in self._pending_writes if not f.done() or f.exception()
+        ]
+        self._pending_writes.append(self._io_pool.submit(fn, *args))
+    
+    def flush(self):
+        """
+        Wait for background trace and citation report writes to finish.
+        
+        Waits for all of them, then raises the first error any of them hit.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        wait(pending)
+        for future in pending:
+            future.result()
+    
     def _extract_and_verify_citations(
         self,
         query: str,
         answer: str,
         chunk_results: list,
         trace: ExecutionTrace,
+        verify_data: Optional[list] = None,
     ) -> tuple[CitationReport, VerificationResult]:
         """
         Extract citations from chunk results and verify them.
         
         This is the key function for exhaustive extraction queries.
         Like textbook-qa's page reference extraction, but for JSON records.
+        Citations are verified against the loaded data, or against
+        `verify_data` (records collected while chunking a file).
         """
         trace.add_entry(
             TraceEventType.INFO,
             "Extracting citations from chunk results",
         )
         
-        # Extract citations from each chunk's response
+        # Extract citations from each chunk's response (repeats sharing
+        # another chunk's answer would cite that chunk's records)
         all_chunk_citations = []
         
         for result in chunk_results:
+            if result.shared_from is not None:
+                continue
             if result.success and result.content and "NO_RELEVANT_CONTENT" not in result.content:
                 chunk_citations = CitationExtractor.extract_from_response(
                     response=result.content,
@@ -457,7 +562,7 @@ class JsonExplorer:
                 )
                 all_chunk_citations.append(chunk_citations)
         
-        # Merge and deduplicate
+        # Merge and deduplicate (one hash pass keyed on the normalized quote)
         merged_citations = CitationExtractor.merge_citations(
             all_chunk_citations,
             deduplicate=True,
@@ -473,9 +578,10 @@ class JsonExplorer:
             citation_report.add_citation(citation)
         
         # Verify against original data if available
-        if self._data:
+        data = self._data or verify_data
+        if data:
             content_field = self._schema.content_field or "content"
-            citation_report.verify(self._data, content_field)
+            citation_report.verify(data, content_field)
         
         # Build verification result
         verification = VerificationResult(
@@ -506,23 +612,22 @@ class JsonExplorer:
         verification = VerificationResult()
         
         # Check for blockquotes (citations)
-        quotes = re.findall(r'>\s*"?(.+?)"?\s*\n', answer)
+        quotes = _QUOTE_RE.findall(answer)
         verification.citations_found = len(quotes)
         verification.has_citations = verification.citations_found > 0
         
         # Check for reference patterns
-        ref_pattern = r'\[\d+\.\d+\]|\[ref:\s*\d+\]|\[chunk\s*\d+\]'
-        refs = re.findall(ref_pattern, answer, re.IGNORECASE)
+        refs = _REF_RE.findall(answer)
         verification.reference_ids = refs
         
         # Check for issues based on query
         query_lower = query.lower()
         
-        if any(word in query_lower for word in ["all", "every", "exhaustive", "complete"]):
+        if _EXHAUSTIVE_WORDS_RE.search(query_lower):
             if verification.citations_found < 3:
                 verification.issues.append("Query asked for exhaustive results but few citations found")
         
-        if "who" in query_lower and not re.search(r'@\w+|\w+\s+said', answer):
+        if "who" in query_lower and not _WHO_RE.search(answer):
             verification.issues.append("Query asked 'who' but no usernames found in answer")
         
         return verification
@@ -542,44 +647,27 @@ class JsonExplorer:
         - Add verification summary
         """
         # Clean up common LLM artifacts
-        answer = re.sub(r'\n{3,}', '\n\n', answer)
+        answer = _BLANKLINES_RE.sub('\n\n', answer)
         
         # Add verification summary at the end if we have verification data
         if verification and verification.has_citations:
-            summary = f"""
-
----
-
-## 🔍 Verification Summary
-
-| Metric | Value |
-|--------|-------|
-| Citations found | {verification.citations_found} |
-| Unique contributors | {verification.unique_authors} |
-| Positive mentions | {verification.positive_mentions} |
-| Negative mentions | {verification.negative_mentions} |
-| Neutral mentions | {verification.neutral_mentions} |
-"""
+            parts = [_VERIFICATION_TEMPLATE.format_map(verification.to_dict())]
             
             if verification.issues:
-                summary += "\n**Issues:**\n"
-                for issue in verification.issues:
-                    summary += f"- ⚠️ {issue}\n"
+                parts.append("\n**Issues:**\n")
+                parts.extend(f"- ⚠️ {issue}\n" for issue in verification.issues)
             
             if verification.reference_ids:
-                summary += f"\n**Reference IDs:** `{', '.join(verification.reference_ids[:10])}`"
+                parts.append(f"\n**Reference IDs:** `{', '.join(verification.reference_ids[:10])}`")
                 if len(verification.reference_ids) > 10:
-                    summary += f" ... and {len(verification.reference_ids) - 10} more"
+                    parts.append(f" ... and {len(verification.reference_ids) - 10} more")
             
-            answer += summary
+            answer += "".join(parts)
         
         return answer
     
     def _save_citation_report(self, report: CitationReport, output_dir: str):
         """Save citation report to file."""
-        from pathlib import Path
-        import json
-        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -587,13 +675,13 @@ class JsonExplorer:
         
         # Save markdown version
         md_path = output_path / f"citations_{timestamp}.md"
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(report.to_markdown())
+        with open(md_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(report.to_markdown().encode('utf-8'))
         
-        # Save JSON version for programmatic access
+        # Save JSON version for programmatic access (orjson when installed)
         json_path = output_path / f"citations_{timestamp}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(report.to_dict(), f, indent=2)
+        with open(json_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(report.to_json_bytes(indent=True))
     
     def stream_query(
         self,
@@ -617,41 +705,49 @@ class JsonExplorer:
         yield f"🔍 Analyzing query: {query}\n"
         
         # Plan
-        plan = self._planner.plan(query)
+        plan = self._plan(query)
         yield f"📋 Plan: {plan.intent.value} ({plan.reasoning})\n"
         
-        # Get chunks
-        if self._data:
-            chunks = list(self._chunker.chunk_from_data(self._data))
-        else:
-            chunks = list(self._chunker.chunk_from_file(self._file_path))
+        yield f"📦 Processing chunks...\n"
         
-        yield f"📦 Processing {len(chunks)} chunks...\n"
+        # Chunk calls run on a producer thread and report progress through a
+        # bounded queue, so they keep going while the caller handles output
+        found: dict[int, str] = {}
+        events: Queue = Queue(maxsize=2 * max(1, self.config.parallel_chunks))
+        stop = threading.Event()
         
-        # Process chunks
-        results = []
-        for i, chunk in enumerate(chunks):
-            # Apply filter
-            if plan.filter_criteria.keywords:
-                text_lower = chunk.text_content.lower()
-                if not any(kw.lower() in text_lower for kw in plan.filter_criteria.keywords):
-                    continue
-            
-            yield f"  Processing chunk {i+1}/{len(chunks)}...\n"
-            
-            prompt = plan.chunk_prompt + "\n\n---\n\n" + chunk.to_llm_context()
-            
+        def produce():
+            progress = self._stream_chunks(plan, found)
             try:
-                content, tokens = self.llm.complete(prompt)
-                if "NO_RELEVANT_CONTENT" not in content:
-                    results.append(content)
-                    yield f"  ✓ Found relevant content\n"
+                for message in progress:
+                    events.put(message)
+                    if stop.is_set():
+                        break
             except Exception as e:
-                yield f"  ✗ Error: {e}\n"
-            
-            # Check limit
-            if plan.chunk_limit and len(results) >= plan.chunk_limit:
-                break
+                events.put(e)
+            finally:
+                progress.close()
+                events.put(_STREAM_DONE)
+        
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while (item := events.get()) is not _STREAM_DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Caller stopped early: signal the producer and unblock its put()
+            stop.set()
+            try:
+                while True:
+                    events.get_nowait()
+            except Empty:
+                pass
+        
+        # Aggregate in chunk order regardless of completion order
+        results = [found[i] for i in sorted(found)]
+        if plan.chunk_limit:
+            results = results[:plan.chunk_limit]
         
         yield f"\n🔗 Aggregating {len(results)} results...\n"
         
@@ -663,11 +759,91 @@ class JsonExplorer:
         findings = "\n\n---\n\n".join(results)
         prompt = plan.aggregate_prompt + "\n\n---\n\n" + findings
         
+        # Stream the answer as it is generated when the client supports it
+        if not hasattr(self.llm, "stream"):
+            try:
+                answer, tokens = self.llm.complete(prompt)
+                yield f"\n✅ Answer:\n\n{answer}\n"
+            except Exception as e:
+                yield f"\n❌ Aggregation failed: {e}\n"
+            return
+        
+        pieces = self.llm.stream(prompt)
         try:
-            answer, tokens = self.llm.complete(prompt)
-            yield f"\n✅ Answer:\n\n{answer}\n"
+            first = next(pieces)
+        except StopIteration:
+            first = ""
         except Exception as e:
             yield f"\n❌ Aggregation failed: {e}\n"
+            return
+        
+        yield f"\n✅ Answer:\n\n{first}"
+        try:
+            yield from pieces
+        except Exception as e:
+            yield f"\n❌ Aggregation failed: {e}\n"
+            return
+        yield "\n"
+    
+    def _stream_chunks(self, plan: QueryPlan, found: dict[int, str]) -> Iterator[str]:
+        """
+        Run the chunk calls for stream_query, yielding progress lines.
+        
+        Relevant answers are stored in `found` by chunk index.
+        """
+        # Filter and batch chunks as they are built, keeping a bounded
+        # window of LLM calls in flight
+        keywords = plan.filter_criteria.keywords
+        has_keyword = keyword_matcher(keywords) if keywords else None
+        max_workers = max(1, self.config.parallel_chunks if plan.parallel_ok else 1)
+        max_in_flight = max_workers * 2
+        
+        chunks = self._iter_chunks()
+        if has_keyword:
+            chunks = (c for c in chunks if has_keyword(c.text_content_lower))
+        batches = self._executor.batch_chunks(chunks)
+        
+        exhausted = False
+        in_flight: dict[Future, list[int]] = {}
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    
+                    future = pool.submit(self._executor.complete_batch, batch, plan.chunk_prompt)
+                    in_flight[future] = [chunk.index for chunk in batch]
+                
+                if not in_flight:
+                    continue
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: in_flight[f][0]):
+                    indices = in_flight.pop(future)
+                    
+                    try:
+                        contents, tokens = future.result()
+                    except Exception as e:
+                        for i in indices:
+                            yield f"  Processed chunk {i+1}\n"
+                        yield f"  ✗ Error: {e}\n"
+                        continue
+                    
+                    for i, content in zip(indices, contents):
+                        yield f"  Processed chunk {i+1}\n"
+                        if "NO_RELEVANT_CONTENT" not in content:
+                            found[i] = content
+                            yield f"  ✓ Found relevant content\n"
+                
+                # Check limit
+                if plan.chunk_limit and len(found) >= plan.chunk_limit:
+                    break
+        finally:
+            # Drop calls not yet started (limit reached or caller stopped early)
+            pool.shutdown(wait=False, cancel_futures=True)
     
     def get_sample(self, n: int = 5) -> list[dict]:
         """
@@ -685,6 +861,17 @@ class JsonExplorer:
         if not self._file_path:
             raise ValueError("No file loaded.")
         
+        # Stream just the first n records when the layout is known
+        prefix = self._records_prefix()
+        if HAS_IJSON and prefix:
+            sample = []
+            with open(self._file_path, 'rb') as f:
+                for record in ijson.items(f, prefix, use_float=True):
+                    if len(sample) >= n:
+                        break
+                    sample.append(record)
+            return sample
+        
         import json
         with open(self._file_path, 'r') as f:
             data = json.load(f)
@@ -696,20 +883,80 @@ class JsonExplorer:
         else:
             return [data]
     
+    def _plan(self, query: str) -> QueryPlan:
+        """Plan a query, reusing the plan from an identical earlier query."""
+        plan = self._plan_cache.get(query)
+        if plan is not None:
+            self._plan_cache.move_to_end(query)
+            return plan
+        
+        plan = self._planner.plan(query)
+        self._plan_cache[query] = plan
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return plan
+    
+    def _iter_chunks(self, keep_records: bool = False) -> Iterator[Chunk]:
+        """Lazily chunk the loaded data (in memory or from file)."""
+        if self._data:
+            return self._chunker.chunk_from_data(self._data)
+        return self._chunker.chunk_from_file(self._file_path, keep_records=keep_records)
+    
+    def _records_prefix(self) -> Optional[str]:
+        """ijson prefix of the record array in the loaded file, if known."""
+        schema = self._schema
+        if not schema or schema.total_records is None:
+            return None  # JSONL or generic object
+        if schema.root_type == "array":
+            return "item"
+        if schema.root_type == "object" and schema.format == JsonFormat.DISCORD:
+            return "messages.item"
+        return None
+    
     def clear_cache(self):
-        """Clear the chunk result cache."""
+        """Clear the chunk result cache (entries shared through cache_path are kept)."""
         if self._executor:
             self._executor.clear_cache()
     
+    def purge_shared_cache(self):
+        """Clear the chunk result cache, including this namespace's shared entries."""
+        if self._executor:
+            self._executor.purge_shared_cache()
+    
+    def cache_stats(self) -> dict:
+        """Chunk result cache stats (empty before a file is loaded)."""
+        return self._executor.cache_stats() if self._executor else {}
+    
+    def close(self):
+        """
+        Shut down formatting worker processes and close the shared cache file.
+        
+        Call when discarding an explorer; loading a file starts them afresh.
+        """
+        if self._chunker:
+            self._chunker.close()
+        if self._executor:
+            self._executor.close()
+    
     def reset(self):
-        """Reset all state."""
+        """
+        Reset all state.
+        
+        Pending background writes are waited for last, so a failed write
+        is raised only after the state has been reset.
+        """
         self._file_path = None
         self._schema = None
         self._data = None
+        if self._chunker:
+            self._chunker.close()
         self._chunker = None
         self._planner = None
         if self._executor:
             self._executor.clear_cache()
+            self._executor.close()
         self._executor = None
         self._aggregator = None
+        self._plan_cache.clear()
+        self.flush()
 
@@ -9,17 +9,135 @@ Design Philosophy:
 """
 
 import os
+import re
+import json
 import time
 import hashlib
-from dataclasses import dataclass, field
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import Optional, Any, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from .chunker import Chunk
 from .query_planner import QueryPlan, FilterCriteria
 from .schema import JsonSchema
 from .trace import ExecutionTrace, TraceEventType
 
+# pyahocorasick (if available) matches all filter keywords in one scan
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    ahocorasick = None
+
+# orjson (if available) speeds up batch job JSONL encoding/decoding
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+# Rough prompt size in characters per token, for checking the budget before a call
+CHARS_PER_TOKEN = 4
+
+# Below this many keywords, per-keyword substring scans beat the automaton
+# (and a stdlib regex alternation is slower than both)
+AUTOMATON_MIN_KEYWORDS = 32
+
+
+def build_batch_prompt(chunk_prompt: str, chunks: list[Chunk]) -> str:
+    """Build one prompt covering several chunks, each behind a CHUNK i/k marker."""
+    k = len(chunks)
+    parts = [
+        chunk_prompt,
+        "\n\n---\n\n",
+        f"The {k} chunks below are independent. Answer for each chunk separately, "
+        f"starting each answer with its marker line exactly as given (CHUNK 1/{k}:, "
+        f"CHUNK 2/{k}:, ...). If a chunk has nothing relevant, answer "
+        f"NO_RELEVANT_CONTENT for that chunk.\n",
+    ]
+    for n, chunk in enumerate(chunks, 1):
+        if n > 1:
+            parts.append("\n---\n")
+        parts.append(f"\nCHUNK {n}/{k}:\n{chunk.to_llm_context()}\n")
+    return "".join(parts)
+
+
+def split_batch_response(content: str, k: int) -> Optional[list[str]]:
+    """
+    Split a batched response back into per-chunk answers.
+    
+    Returns None unless markers CHUNK 1/k .. CHUNK k/k each appear once, in order.
+    """
+    markers = list(re.finditer(rf'^\s*\**CHUNK (\d+)/{k}:\**[ \t]*', content, re.MULTILINE))
+    if [int(m.group(1)) for m in markers] != list(range(1, k + 1)):
+        return None
+    
+    ends = [m.start() for m in markers[1:]] + [len(content)]
+    return [
+        content[m.end():end].strip().removesuffix("---").strip()
+        for m, end in zip(markers, ends)
+    ]
+
+
+def keyword_matcher(keywords: list[str]) -> Callable[[str], bool]:
+    """
+    Build a predicate telling whether lowercased text contains any keyword.
+    
+    Uses a single-pass Aho-Corasick automaton when there are enough
+    keywords (AUTOMATON_MIN_KEYWORDS) for it to beat repeated substring checks.
+    """
+    lowered = [kw.lower() for kw in keywords]
+    
+    if HAS_AHOCORASICK and len(lowered) >= AUTOMATON_MIN_KEYWORDS and all(lowered):
+        automaton = ahocorasick.Automaton()
+        for kw in lowered:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text_lower: next(automaton.iter(text_lower), None) is not None
+    
+    return lambda text_lower: any(kw in text_lower for kw in lowered)
+
+
+@lru_cache(maxsize=8)
+def shared_http_client(provider: str, base_url: Optional[str], timeout: int):
+    """
+    Pooled HTTP client shared by every LLMClient for the same endpoint.
+    
+    Keeps connections alive between chunk calls (and across executors), so
+    each call skips the TCP+TLS handshake. HTTP/2 is used when the h2
+    package is installed.
+    """
+    import httpx
+    
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    if provider == "openai":
+        from openai import DefaultHttpxClient
+    else:
+        from anthropic import DefaultHttpxClient
+    
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=90,
+        ),
+        http2=http2,
+        timeout=timeout,
+    )
+
 
 @dataclass
 class ChunkResult:
@@ -33,6 +151,7 @@ class ChunkResult:
     duration_ms: float = 0
     was_cached: bool = False
     was_filtered: bool = False  # True if chunk was skipped due to filter
+    shared_from: Optional[int] = None  # Index of the identical chunk whose answer this reuses
     
     # Original chunk reference
     chunk_metadata: dict = field(default_factory=dict)
@@ -88,6 +207,208 @@ class ExecutionResult:
         }
 
 
+class ChunkCache:
+    """
+    Bounded LRU cache of chunk results with an optional time-to-live.
+    
+    Thread-safe, since parallel chunk workers read and write it. Expired
+    entries count as misses; past max_entries the least recently used
+    entry is evicted.
+    
+    With a path, results are also written through to a SQLite file
+    (memory-mapped, WAL mode), so every explorer process on the host
+    pointed at the same file reuses each other's chunk answers. Entries
+    are scoped by namespace so different users or projects sharing the
+    file don't see each other's results.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: Optional[float] = None,
+        path: Optional[str] = None,
+        namespace: str = "",
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.namespace = namespace
+        
+        self._entries: OrderedDict[str, tuple[float, ChunkResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = self._open_store(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_hits = 0
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return self._live(key) is not None
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[ChunkResult]:
+        """Get a cached result, counting the hit or miss."""
+        with self._lock:
+            result = self._live(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return result
+    
+    def set(self, key: str, result: ChunkResult):
+        """Cache a result, evicting the least recently used entries if full."""
+        with self._lock:
+            self._remember(key, time.monotonic(), result)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO chunk_results VALUES (?, ?, ?, ?)",
+                        (self.namespace, key, time.time(), json.dumps(asdict(result), default=str)),
+                    )
+    
+    def clear(self):
+        """
+        Drop the in-memory entries (stats are kept).
+        
+        Shared entries in the SQLite file are left for the other processes
+        using it; purge_shared() removes them.
+        """
+        with self._lock:
+            self._entries.clear()
+    
+    def purge_shared(self):
+        """Drop this namespace's entries from memory and from the shared file."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "DELETE FROM chunk_results WHERE namespace = ?", (self.namespace,)
+                    )
+    
+    def close(self):
+        """Close the shared file, if any; in-memory entries stay usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def stats(self) -> dict:
+        """Entry count and hit/miss/eviction counters, for tuning max_entries."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "path": self.path,
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+    
+    def _live(self, key: str) -> Optional[ChunkResult]:
+        """Entry for key if present and unexpired; call with the lock held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._load_shared(key)
+        
+        stored_at, result = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        return result
+    
+    def _remember(self, key: str, stored_at: float, result: ChunkResult):
+        """Add to the in-memory LRU; call with the lock held."""
+        self._entries[key] = (stored_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def _load_shared(self, key: str) -> Optional[ChunkResult]:
+        """Result another process (or an earlier run) stored; call with the lock held."""
+        if self._db is None:
+            return None
+        
+        row = self._db.execute(
+            "SELECT stored_at, result FROM chunk_results WHERE namespace = ? AND key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        
+        # Wall-clock age, since monotonic clocks aren't comparable across processes
+        age = time.time() - row[0]
+        if self.ttl_seconds is not None and age > self.ttl_seconds:
+            return None
+        
+        result = ChunkResult(**json.loads(row[1]))
+        self._remember(key, time.monotonic() - age, result)
+        self.shared_hits += 1
+        return result
+    
+    def _open_store(self, path: str) -> sqlite3.Connection:
+        """Open (creating if needed) the shared results file, dropping expired rows."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        # Connection is shared by worker threads; access is serialized by self._lock
+        db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA mmap_size=268435456")
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS chunk_results ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, "
+                "result TEXT NOT NULL, PRIMARY KEY (namespace, key))"
+            )
+            if self.ttl_seconds is not None:
+                db.execute(
+                    "DELETE FROM chunk_results WHERE stored_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+        return db
+
+
+class RateLimiter:
+    """
+    Paces calls to at most requests_per_minute, spaced evenly.
+    
+    Thread-safe: each caller claims the next free slot, then sleeps until
+    it comes round.
+    """
+    
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60.0 / requests_per_minute
+        
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the caller may make its next call."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long until it starts."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            return slot - now
+
+
 class LLMClient:
     """
     Simple LLM client abstraction.
@@ -123,7 +444,10 @@ class LLMClient:
             
             try:
                 import anthropic
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                self.client = anthropic.Anthropic(
+                    api_key=self.api_key,
+                    http_client=shared_http_client(provider, base_url, timeout),
+                )
             except ImportError:
                 raise ImportError("anthropic package required: pip install anthropic")
         
@@ -139,6 +463,7 @@ class LLMClient:
                     api_key=self.api_key,
                     base_url=base_url or "https://api.z.ai/api/anthropic",
                     timeout=timeout,
+                    http_client=shared_http_client(provider, base_url, timeout),
                 )
                 # Map model name if needed
                 self.model = self.ZAI_MODEL_MAPPING.get(model, model)
@@ -152,7 +477,10 @@ class LLMClient:
             
             try:
                 from openai import OpenAI
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = OpenAI(
+                    api_key=self.api_key,
+                    http_client=shared_http_client(provider, base_url, timeout),
+                )
             except ImportError:
                 raise ImportError("openai package required: pip install openai")
         
@@ -174,6 +502,157 @@ class LLMClient:
         else:
             return self._call_openai(prompt, system_prompt, max_tokens)
     
+    def stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4096,
+    ) -> Iterator[str]:
+        """
+        Call LLM and yield the response text as it is generated.
+        """
+        if self.provider in ["anthropic", "zai"]:
+            with self.client.messages.stream(
+                **self._anthropic_request(prompt, system_prompt, max_tokens)
+            ) as stream:
+                yield from stream.text_stream
+            return
+        
+        response = self.client.chat.completions.create(
+            **self._openai_request(prompt, system_prompt, max_tokens),
+            stream=True,
+        )
+        for event in response:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+    
+    @property
+    def supports_batch_api(self) -> bool:
+        """Whether complete_via_batch() is available for this provider."""
+        return self.provider in ("anthropic", "openai")
+    
+    def complete_via_batch(
+        self,
+        prompts: dict[str, str],
+        max_tokens: int = 4096,
+        poll_interval: float = 30.0,
+    ) -> tuple[dict[str, tuple[str, int]], dict[str, str]]:
+        """
+        Run prompts through the provider's batch API and wait for the results.
+        
+        Batch jobs cost half as much as real-time calls but may take up to
+        24 hours, so this is for non-interactive runs.
+        
+        Args:
+            prompts: Prompt per custom ID
+            max_tokens: Max tokens per response
+            poll_interval: Seconds between job status checks
+            
+        Returns:
+            ({custom_id: (response, tokens_used)}, {custom_id: error}) -
+            every ID ends up in exactly one of the two
+        """
+        if not self.supports_batch_api:
+            raise ValueError(f"Batch API not supported for provider: {self.provider}")
+        
+        if self.provider == "anthropic":
+            results, errors = self._batch_anthropic(prompts, max_tokens, poll_interval)
+        else:
+            results, errors = self._batch_openai(prompts, max_tokens, poll_interval)
+        
+        for custom_id in prompts:
+            if custom_id not in results and custom_id not in errors:
+                errors[custom_id] = "Missing from batch output"
+        
+        return results, errors
+    
+    def _batch_anthropic(
+        self,
+        prompts: dict[str, str],
+        max_tokens: int,
+        poll_interval: float,
+    ) -> tuple[dict[str, tuple[str, int]], dict[str, str]]:
+        """Run a Message Batches job."""
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": self._anthropic_request(prompt, None, max_tokens),
+                }
+                for custom_id, prompt in prompts.items()
+            ],
+        )
+        
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+        
+        results: dict[str, tuple[str, int]] = {}
+        errors: dict[str, str] = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = self._anthropic_result(entry.result.message)
+            elif entry.result.type == "errored":
+                errors[entry.custom_id] = str(entry.result.error)
+            else:
+                errors[entry.custom_id] = f"Batch request {entry.result.type}"
+        
+        return results, errors
+    
+    def _batch_openai(
+        self,
+        prompts: dict[str, str],
+        max_tokens: int,
+        poll_interval: float,
+    ) -> tuple[dict[str, tuple[str, int]], dict[str, str]]:
+        """Upload a JSONL of requests and run an OpenAI batch job over it."""
+        dumps = orjson.dumps if HAS_ORJSON else lambda obj: json.dumps(obj).encode()
+        lines = [
+            dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_request(prompt, None, max_tokens),
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        input_file = self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        loads = orjson.loads if HAS_ORJSON else json.loads
+        results: dict[str, tuple[str, int]] = {}
+        errors: dict[str, str] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).content.splitlines():
+                if not line.strip():
+                    continue
+                entry = loads(line)
+                response = entry.get("response") or {}
+                if entry.get("error") or response.get("status_code") != 200:
+                    errors[entry["custom_id"]] = str(entry.get("error") or response.get("body"))
+                    continue
+                body = response["body"]
+                usage = body["usage"]
+                results[entry["custom_id"]] = (
+                    body["choices"][0]["message"]["content"],
+                    usage["prompt_tokens"] + usage["completion_tokens"],
+                )
+        
+        return results, errors
+    
     def _call_anthropic(
         self,
         prompt: str,
@@ -182,12 +661,27 @@ class LLMClient:
     ) -> tuple[str, int]:
         """Call Anthropic API."""
         response = self.client.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=system_prompt or "You are a helpful data analyst.",
-            messages=[{"role": "user", "content": prompt}],
+            **self._anthropic_request(prompt, system_prompt, max_tokens)
         )
-        
+        return self._anthropic_result(response)
+    
+    def _anthropic_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build Anthropic messages.create() arguments."""
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "system": system_prompt or "You are a helpful data analyst.",
+            "messages": [{"role": "user", "content": prompt}],
+        }
+    
+    @staticmethod
+    def _anthropic_result(response) -> tuple[str, int]:
+        """Extract (content, tokens_used) from an Anthropic response."""
         content = response.content[0].text
         tokens = response.usage.input_tokens + response.usage.output_tokens
         
@@ -200,17 +694,32 @@ class LLMClient:
         max_tokens: int,
     ) -> tuple[str, int]:
         """Call OpenAI API."""
+        response = self.client.chat.completions.create(
+            **self._openai_request(prompt, system_prompt, max_tokens)
+        )
+        return self._openai_result(response)
+    
+    def _openai_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build OpenAI chat.completions.create() arguments."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=messages,
-        )
-        
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": messages,
+        }
+    
+    @staticmethod
+    def _openai_result(response) -> tuple[str, int]:
+        """Extract (content, tokens_used) from an OpenAI response."""
         content = response.choices[0].message.content
         tokens = response.usage.prompt_tokens + response.usage.completion_tokens
         
@@ -235,19 +744,31 @@ class ChunkExecutor:
         max_parallel: int = 4,
         cache_enabled: bool = True,
         max_tokens_budget: Optional[int] = None,
+        batch_size: int = 1,
+        max_batch_chars: int = 50_000,
+        cache_max_entries: int = 10_000,
+        cache_ttl_seconds: Optional[float] = None,
+        cache_path: Optional[str] = None,
+        cache_namespace: str = "",
+        requests_per_minute: Optional[float] = None,
     ):
         self.llm = llm_client
         self.schema = schema
         self.max_parallel = max_parallel
         self.cache_enabled = cache_enabled
         self.max_tokens_budget = max_tokens_budget
+        self.batch_size = batch_size  # Chunks per LLM call
+        self.max_batch_chars = max_batch_chars  # Combined chunk size cap per batch
         
-        self._cache: dict[str, ChunkResult] = {}
+        # With cache_path, results are shared with other processes using the same file
+        self._cache = ChunkCache(cache_max_entries, cache_ttl_seconds, cache_path, cache_namespace)
+        # Paces LLM calls to stay under provider rate limits (None = unpaced)
+        self._rate_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
         self._tokens_used = 0
     
     def execute(
         self,
-        chunks: list[Chunk],
+        chunks: Iterable[Chunk],
         plan: QueryPlan,
         trace: Optional[ExecutionTrace] = None,
     ) -> ExecutionResult:
@@ -255,67 +776,138 @@ class ChunkExecutor:
         Execute the query plan against all chunks.
         
         Args:
-            chunks: List of chunks to process
+            chunks: Chunks to process (pulled lazily, so a generator works)
             plan: Query execution plan
             trace: Optional trace for logging
             
         Returns:
             ExecutionResult with all chunk results and aggregation
         """
+        if plan.batch_ok and getattr(self.llm, "supports_batch_api", False):
+            return self.execute_batch(chunks, plan, trace)
+        
         start_time = time.time()
         self._tokens_used = 0
         
         result = ExecutionResult(
             query=plan.query,
             success=True,
-            total_chunks=len(chunks),
         )
         
         try:
-            # Phase 1: Filter chunks
-            filtered_chunks = self._filter_chunks(chunks, plan.filter_criteria, trace)
-            result.chunks_filtered = len(chunks) - len(filtered_chunks)
-            
-            if trace:
-                trace.add_entry(
-                    TraceEventType.INFO,
-                    f"Filtered {result.chunks_filtered} chunks, {len(filtered_chunks)} remaining",
-                )
-            
-            # Check chunk limit
-            if plan.chunk_limit and len(filtered_chunks) > plan.chunk_limit:
-                filtered_chunks = filtered_chunks[:plan.chunk_limit]
-                if trace:
-                    trace.add_entry(
-                        TraceEventType.WARNING,
-                        f"Limiting to {plan.chunk_limit} chunks",
-                    )
-            
-            # Phase 2: Process chunks
+            # Phases 1-2: Filter, then process chunks (small consecutive chunks
+            # share a call, chunks repeating earlier content share its answer)
+            duplicates: list[tuple[int, dict, int]] = []
+            batches = self._plan_batches(chunks, plan, result, duplicates)
             if plan.parallel_ok and self.max_parallel > 1:
                 chunk_results = self._process_parallel(
-                    filtered_chunks, plan, trace
+                    batches, plan, trace
                 )
             else:
                 chunk_results = self._process_sequential(
-                    filtered_chunks, plan, trace
+                    batches, plan, trace
                 )
+            chunk_results = self._share_duplicate_results(chunk_results, duplicates)
+            
+            relevant_results = self._record_results(result, chunk_results, plan, trace)
             
-            result.chunk_results = chunk_results
-            result.chunks_processed = len([r for r in chunk_results if r.success and not r.was_filtered])
-            result.chunks_cached = len([r for r in chunk_results if r.was_cached])
-            result.total_tokens = self._tokens_used
+            # Phase 3: Aggregate results
+            if relevant_results:
+                result.aggregated_content = self._aggregate_results(
+                    relevant_results, plan, trace
+                )
+            else:
+                result.aggregated_content = "No relevant content found matching the query."
             
-            # Check for budget exceeded
-            if self.max_tokens_budget and self._tokens_used >= self.max_tokens_budget:
+        except Exception as e:
+            result.success = False
+            result.error = str(e)
+            if trace:
+                trace.log_error(str(e))
+        
+        result.total_duration_ms = (time.time() - start_time) * 1000
+        
+        return result
+    
+    def execute_batch(
+        self,
+        chunks: Iterable[Chunk],
+        plan: QueryPlan,
+        trace: Optional[ExecutionTrace] = None,
+        poll_interval: float = 30.0,
+    ) -> ExecutionResult:
+        """
+        Execute the query plan with chunk calls sent as one provider batch job.
+        
+        For non-interactive runs: batch jobs cost half as much as real-time
+        calls but can take up to 24 hours. Cached chunks are served as usual;
+        the single aggregation call is made in real time. Chunks that would
+        push the estimated spend past max_tokens_budget are left out of the
+        job and reported as budget-skipped.
+        """
+        start_time = time.time()
+        self._tokens_used = 0
+        
+        result = ExecutionResult(
+            query=plan.query,
+            success=True,
+        )
+        
+        try:
+            chunk_results: list[ChunkResult] = []
+            pending: dict[str, tuple[Chunk, str]] = {}
+            duplicates: list[tuple[int, dict, int]] = []
+            
+            # The whole job is paid for once submitted, so the budget is
+            # applied up front: each chunk's estimate counts against the
+            # chunks already committed to the job
+            committed_chars = 0
+            
+            for batch in self._plan_batches(chunks, plan, result, duplicates):
+                for chunk in batch:
+                    cache_key = self._cache_key(chunk, plan.query)
+                    cached = self._cached_result(chunk, cache_key, trace)
+                    if cached is not None:
+                        chunk_results.append(cached)
+                        continue
+                    
+                    prompt_chars = len(plan.chunk_prompt) + chunk.char_count
+                    if self._would_exceed_budget(committed_chars + prompt_chars):
+                        chunk_results.append(self._budget_skip(chunk, trace))
+                        continue
+                    
+                    committed_chars += prompt_chars
+                    pending[f"chunk-{chunk.index}"] = (chunk, cache_key)
+            
+            if pending:
                 if trace:
                     trace.add_entry(
-                        TraceEventType.WARNING,
-                        f"Token budget exceeded: {self._tokens_used}/{self.max_tokens_budget}",
+                        TraceEventType.INFO,
+                        f"Submitting {len(pending)} chunks as a batch job",
                     )
+                
+                batch_start = time.time()
+                answers, errors = self.llm.complete_via_batch(
+                    {
+                        custom_id: self._chunk_llm_prompt(plan.chunk_prompt, chunk)
+                        for custom_id, (chunk, _) in pending.items()
+                    },
+                    poll_interval=poll_interval,
+                )
+                
+                for custom_id, (chunk, cache_key) in pending.items():
+                    if custom_id in answers:
+                        content, tokens = answers[custom_id]
+                        chunk_results.append(
+                            self._chunk_done(chunk, cache_key, content, tokens, batch_start, trace)
+                        )
+                    else:
+                        error = RuntimeError(errors.get(custom_id, "Missing from batch output"))
+                        chunk_results.append(self._chunk_failed(chunk, error, batch_start, trace))
             
-            # Phase 3: Aggregate results
-            relevant_results = [r for r in chunk_results if r.success and r.content and "NO_RELEVANT_CONTENT" not in r.content]
+            chunk_results.sort(key=lambda r: r.chunk_index)
+            chunk_results = self._share_duplicate_results(chunk_results, duplicates)
+            relevant_results = self._record_results(result, chunk_results, plan, trace)
             
             if relevant_results:
                 result.aggregated_content = self._aggregate_results(
@@ -334,95 +926,472 @@ class ChunkExecutor:
         
         return result
     
+    def _plan_batches(
+        self,
+        chunks: Iterable[Chunk],
+        plan: QueryPlan,
+        result: ExecutionResult,
+        duplicates: list[tuple[int, dict, int]],
+    ) -> Iterator[list[Chunk]]:
+        """Lazily filter, limit, dedupe and batch chunks for processing."""
+        filtered_chunks = self._filter_chunks(chunks, plan.filter_criteria, result)
+        
+        # Check chunk limit
+        if plan.chunk_limit:
+            filtered_chunks = islice(filtered_chunks, plan.chunk_limit)
+        
+        return self.batch_chunks(self._dedupe_chunks(filtered_chunks, duplicates))
+    
+    @staticmethod
+    def _dedupe_chunks(
+        chunks: Iterable[Chunk],
+        duplicates: list[tuple[int, dict, int]],
+    ) -> Iterator[Chunk]:
+        """
+        Pass through chunks with unseen content, holding back repeats.
+        
+        Each repeat is recorded in `duplicates` as (chunk index, chunk metadata,
+        index of the first chunk with the same content), so it can share that
+        chunk's result instead of making an identical LLM call. Chunks only
+        count as repeats within the same group and time window, which the
+        prompt also shows the LLM.
+        """
+        first_seen: dict[tuple, int] = {}
+        
+        for chunk in chunks:
+            key = (chunk.content_digest, chunk.group_value, chunk.start_timestamp, chunk.end_timestamp)
+            first = first_seen.setdefault(key, chunk.index)
+            if first == chunk.index:
+                yield chunk
+            else:
+                duplicates.append((chunk.index, chunk.to_dict(), first))
+    
+    @staticmethod
+    def _share_duplicate_results(
+        chunk_results: list[ChunkResult],
+        duplicates: list[tuple[int, dict, int]],
+    ) -> list[ChunkResult]:
+        """
+        Give each held-back repeat chunk a copy of its first chunk's result.
+        
+        Copies are marked with shared_from: the answer text still refers to
+        the first chunk's records, so citations are taken from that one only.
+        """
+        if not duplicates:
+            return chunk_results
+        
+        by_index = {r.chunk_index: r for r in chunk_results}
+        for index, metadata, first in duplicates:
+            source = by_index[first]
+            chunk_results.append(
+                ChunkResult(
+                    chunk_index=index,
+                    success=source.success,
+                    content=source.content,
+                    was_cached=source.success,
+                    was_filtered=source.was_filtered,
+                    shared_from=first,
+                    chunk_metadata=metadata,
+                )
+            )
+        
+        chunk_results.sort(key=lambda r: r.chunk_index)
+        return chunk_results
+    
+    def _record_results(
+        self,
+        result: ExecutionResult,
+        chunk_results: list[ChunkResult],
+        plan: QueryPlan,
+        trace: Optional[ExecutionTrace],
+    ) -> list[ChunkResult]:
+        """Fill in result stats from chunk results and return the relevant ones."""
+        if trace:
+            trace.add_entry(
+                TraceEventType.INFO,
+                f"Filtered {result.chunks_filtered} chunks, "
+                f"{result.total_chunks - result.chunks_filtered} remaining",
+            )
+            if plan.chunk_limit and len(chunk_results) >= plan.chunk_limit:
+                trace.add_entry(
+                    TraceEventType.WARNING,
+                    f"Limiting to {plan.chunk_limit} chunks",
+                )
+        
+        result.chunk_results = chunk_results
+        result.chunks_processed = len([r for r in chunk_results if r.success and not r.was_filtered])
+        result.chunks_cached = len([r for r in chunk_results if r.was_cached])
+        result.total_tokens = self._tokens_used
+        
+        # Check for budget exceeded
+        if self.max_tokens_budget and self._tokens_used >= self.max_tokens_budget:
+            if trace:
+                trace.add_entry(
+                    TraceEventType.WARNING,
+                    f"Token budget exceeded: {self._tokens_used}/{self.max_tokens_budget}",
+                )
+        
+        return [r for r in chunk_results if r.success and r.content and "NO_RELEVANT_CONTENT" not in r.content]
+    
     def _filter_chunks(
         self,
-        chunks: list[Chunk],
+        chunks: Iterable[Chunk],
         criteria: FilterCriteria,
-        trace: Optional[ExecutionTrace],
-    ) -> list[Chunk]:
-        """Filter chunks based on criteria without LLM calls."""
-        if not criteria.keywords and not criteria.channel_filter and not criteria.author_filter:
-            return chunks
+        result: ExecutionResult,
+    ) -> Iterator[Chunk]:
+        """
+        Lazily filter chunks based on criteria without LLM calls.
         
-        filtered = []
+        Counts every chunk pulled and every chunk dropped on `result`.
+        """
+        matches = self._criteria_matcher(criteria)
         
         for chunk in chunks:
-            # Quick text-based filtering
-            text_lower = chunk.text_content.lower()
+            result.total_chunks += 1
             
-            # Keyword filter
-            if criteria.keywords:
-                if not any(kw.lower() in text_lower for kw in criteria.keywords):
-                    continue
-            
-            # Channel filter
-            if criteria.channel_filter:
-                if criteria.channel_filter.lower() not in text_lower:
-                    continue
+            if matches and not matches(chunk.text_content_lower):
+                result.chunks_filtered += 1
+                continue
             
-            # Author filter
-            if criteria.author_filter:
-                if criteria.author_filter.lower() not in text_lower:
-                    continue
+            yield chunk
+    
+    @staticmethod
+    def _criteria_matcher(criteria: FilterCriteria) -> Optional[Callable[[str], bool]]:
+        """
+        Build a quick text check of a chunk's lowercased text against the criteria.
+        
+        Filter strings are lowercased (and keywords compiled) once per query
+        rather than once per chunk. Returns None when there is nothing to check.
+        """
+        checks: list[Callable[[str], bool]] = []
+        
+        # Keyword filter
+        if criteria.keywords:
+            checks.append(keyword_matcher(criteria.keywords))
+        
+        # Channel and author filters
+        for needle in (criteria.channel_filter, criteria.author_filter):
+            if needle:
+                checks.append(lambda text_lower, needle=needle.lower(): needle in text_lower)
+        
+        if not checks:
+            return None
+        if len(checks) == 1:
+            return checks[0]
+        return lambda text_lower: all(check(text_lower) for check in checks)
+    
+    def batch_chunks(self, chunks: Iterable[Chunk]) -> Iterator[list[Chunk]]:
+        """
+        Group consecutive chunks into batches for one LLM call each.
+        
+        A batch holds up to batch_size chunks whose combined size stays within
+        max_batch_chars; with batch_size 1 every chunk is its own batch.
+        """
+        batch: list[Chunk] = []
+        batch_chars = 0
+        
+        for chunk in chunks:
+            if batch and (
+                len(batch) >= self.batch_size
+                or batch_chars + chunk.char_count > self.max_batch_chars
+            ):
+                yield batch
+                batch = []
+                batch_chars = 0
             
-            filtered.append(chunk)
+            batch.append(chunk)
+            batch_chars += chunk.char_count
         
-        return filtered
+        if batch:
+            yield batch
     
-    def _process_parallel(
+    def complete_batch(
         self,
         chunks: list[Chunk],
+        chunk_prompt: str,
+    ) -> tuple[list[str], int]:
+        """
+        Run the chunk prompt over a batch of chunks.
+        
+        Uses a single LLM call when the batch has several chunks, falling back
+        to one call per chunk if the response can't be split per chunk.
+        
+        Returns:
+            (answers in chunk order, total tokens used)
+        """
+        tokens = 0
+        
+        if len(chunks) > 1:
+            content, tokens = self._complete(build_batch_prompt(chunk_prompt, chunks))
+            answers = split_batch_response(content, len(chunks))
+            if answers is not None:
+                return answers, tokens
+        
+        answers = []
+        for chunk in chunks:
+            content, used = self._complete(self._chunk_llm_prompt(chunk_prompt, chunk))
+            answers.append(content)
+            tokens += used
+        
+        return answers, tokens
+    
+    def _complete(self, prompt: str) -> tuple[str, int]:
+        """Make an LLM call, waiting for the rate limiter first."""
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
+        return self.llm.complete(prompt)
+    
+    @staticmethod
+    def _chunk_llm_prompt(chunk_prompt: str, chunk: Chunk) -> str:
+        """Build the prompt for a single chunk."""
+        return chunk_prompt + "\n\n---\n\n" + chunk.to_llm_context()
+    
+    def _process_parallel(
+        self,
+        batches: Iterable[list[Chunk]],
         plan: QueryPlan,
         trace: Optional[ExecutionTrace],
     ) -> list[ChunkResult]:
-        """Process chunks in parallel."""
+        """
+        Process batches in parallel, with a bounded number in flight.
+        
+        Once the token budget is spent, queued calls are cancelled and the
+        remaining chunks are skipped rather than sent.
+        """
         results = []
+        max_in_flight = self.max_parallel * 2
         
         with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
-            futures = {
-                executor.submit(self._process_chunk, chunk, plan, trace): chunk
-                for chunk in chunks
-            }
+            futures: dict[Future, list[Chunk]] = {}
             
-            for future in as_completed(futures):
-                chunk = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append(ChunkResult(
-                        chunk_index=chunk.index,
-                        success=False,
-                        content=f"Error: {e}",
-                    ))
+            for batch in batches:
+                # Wait for a slot before pulling more chunks from the source
+                if len(futures) >= max_in_flight:
+                    self._collect_done(futures, results)
+                
+                if self._budget_exceeded():
+                    self._cancel_queued(futures, results)
+                    results.extend(self._budget_results(batch))
+                    continue
+                
+                futures[executor.submit(self._process_batch, batch, plan, trace)] = batch
+            
+            while futures:
+                self._collect_done(futures, results)
+                if self._budget_exceeded():
+                    self._cancel_queued(futures, results)
         
         # Sort by chunk index
         results.sort(key=lambda r: r.chunk_index)
         return results
     
+    def _collect_done(self, futures: dict[Future, list[Chunk]], results: list[ChunkResult]):
+        """Wait for at least one future and move finished batches into results."""
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            results.extend(self._future_results(future, futures.pop(future)))
+    
+    def _cancel_queued(self, futures: dict[Future, list[Chunk]], results: list[ChunkResult]):
+        """Cancel calls that haven't started yet, recording their chunks as over budget."""
+        for future in [f for f in futures if f.cancel()]:
+            results.extend(self._budget_results(futures.pop(future)))
+    
+    @staticmethod
+    def _future_results(future: Future, batch: list[Chunk]) -> list[ChunkResult]:
+        """Get a batch's results from its future, turning errors into failed results."""
+        try:
+            return future.result()
+        except Exception as e:
+            return ChunkExecutor._error_results(batch, e)
+    
+    @staticmethod
+    def _error_results(batch: list[Chunk], error: BaseException) -> list[ChunkResult]:
+        """Failed results for every chunk of a batch."""
+        return [
+            ChunkResult(
+                chunk_index=chunk.index,
+                success=False,
+                content=f"Error: {error}",
+            )
+            for chunk in batch
+        ]
+    
     def _process_sequential(
         self,
-        chunks: list[Chunk],
+        batches: Iterable[list[Chunk]],
         plan: QueryPlan,
         trace: Optional[ExecutionTrace],
     ) -> list[ChunkResult]:
-        """Process chunks sequentially."""
+        """Process batches sequentially."""
         results = []
         
-        for chunk in chunks:
+        for batch in batches:
             # Check budget
-            if self.max_tokens_budget and self._tokens_used >= self.max_tokens_budget:
-                results.append(ChunkResult(
-                    chunk_index=chunk.index,
-                    success=False,
-                    content="Budget exceeded",
-                    was_filtered=True,
-                ))
+            if self._budget_exceeded():
+                results.extend(self._budget_results(batch))
                 continue
             
-            result = self._process_chunk(chunk, plan, trace)
+            results.extend(self._process_batch(batch, plan, trace))
+        
+        return results
+    
+    def _budget_exceeded(self) -> bool:
+        """Whether the token budget has been used up."""
+        return bool(self.max_tokens_budget) and self._tokens_used >= self.max_tokens_budget
+    
+    def _would_exceed_budget(self, prompt_chars: int) -> bool:
+        """
+        Whether a prompt this long would overrun the token budget, estimated before sending.
+        
+        Used by every chunk path: per call in real time, and per chunk while
+        assembling a batch job (passing the chars already committed to it).
+        """
+        return bool(self.max_tokens_budget) and (
+            self._tokens_used + prompt_chars // CHARS_PER_TOKEN > self.max_tokens_budget
+        )
+    
+    def _budget_skip(self, chunk: Chunk, trace: Optional[ExecutionTrace]) -> ChunkResult:
+        """Skip a chunk whose call would overrun the token budget."""
+        if trace:
+            trace.add_entry(
+                TraceEventType.CHUNK_SKIP,
+                f"Chunk {chunk.index} skipped: estimated to exceed token budget",
+            )
+        return self._budget_results([chunk])[0]
+    
+    @staticmethod
+    def _budget_results(batch: list[Chunk]) -> list[ChunkResult]:
+        """Skipped results for a batch left unprocessed by the token budget."""
+        return [
+            ChunkResult(
+                chunk_index=chunk.index,
+                success=False,
+                content="Budget exceeded",
+                was_filtered=True,
+            )
+            for chunk in batch
+        ]
+    
+    def _process_batch(
+        self,
+        batch: list[Chunk],
+        plan: QueryPlan,
+        trace: Optional[ExecutionTrace],
+    ) -> list[ChunkResult]:
+        """Process a batch of chunks with one LLM call (cached chunks served individually)."""
+        cached, pending = self._split_cached(batch, plan)
+        
+        # Chunks go one by one if there's only one call to make, or if the
+        # shared call would overrun the budget (smaller ones may still fit)
+        if len(pending) <= 1 or self._would_exceed_budget(
+            len(plan.chunk_prompt) + sum(chunk.char_count for chunk in pending)
+        ):
+            return [self._process_chunk(chunk, plan, trace) for chunk in batch]
+        
+        results = [self._process_chunk(chunk, plan, trace) for chunk in cached]
+        
+        start_time = time.time()
+        self._trace_batch_start(pending, trace)
+        
+        try:
+            answers, tokens = self.complete_batch(pending, plan.chunk_prompt)
+        except Exception as e:
+            return results + self._batch_failed(pending, e, start_time, trace)
+        
+        results.extend(self._batch_done(pending, answers, tokens, start_time, plan, trace))
+        results.sort(key=lambda r: r.chunk_index)
+        return results
+    
+    def _split_cached(
+        self,
+        batch: list[Chunk],
+        plan: QueryPlan,
+    ) -> tuple[list[Chunk], list[Chunk]]:
+        """Split a batch into (cached, pending) chunks."""
+        cached: list[Chunk] = []
+        pending: list[Chunk] = []
+        for chunk in batch:
+            if self.cache_enabled and self._cache_key(chunk, plan.query) in self._cache:
+                cached.append(chunk)
+            else:
+                pending.append(chunk)
+        
+        return cached, pending
+    
+    @staticmethod
+    def _trace_batch_start(pending: list[Chunk], trace: Optional[ExecutionTrace]):
+        """Log the start of a shared call over several chunks."""
+        if trace:
+            trace.add_entry(
+                TraceEventType.CHUNK_START,
+                f"Processing chunks {', '.join(str(chunk.index) for chunk in pending)} in one call "
+                f"({sum(chunk.record_count for chunk in pending)} records)",
+            )
+    
+    @staticmethod
+    def _batch_failed(
+        pending: list[Chunk],
+        error: Exception,
+        start_time: float,
+        trace: Optional[ExecutionTrace],
+    ) -> list[ChunkResult]:
+        """Failed results for a shared call that raised."""
+        duration_ms = (time.time() - start_time) * 1000
+        
+        if trace:
+            trace.add_entry(
+                TraceEventType.LLM_CALL_ERROR,
+                f"Chunks {', '.join(str(chunk.index) for chunk in pending)} failed: {error}",
+                duration_ms=duration_ms,
+            )
+        
+        return [
+            ChunkResult(
+                chunk_index=chunk.index,
+                success=False,
+                content=f"Error: {error}",
+                duration_ms=duration_ms,
+            )
+            for chunk in pending
+        ]
+    
+    def _batch_done(
+        self,
+        pending: list[Chunk],
+        answers: list[str],
+        tokens: int,
+        start_time: float,
+        plan: QueryPlan,
+        trace: Optional[ExecutionTrace],
+    ) -> list[ChunkResult]:
+        """Record and cache the per-chunk results of a shared call."""
+        self._tokens_used += tokens
+        duration_ms = (time.time() - start_time) * 1000
+        results = []
+        
+        # Spread the call's tokens over its chunks
+        share, extra = divmod(tokens, len(pending))
+        for n, (chunk, content) in enumerate(zip(pending, answers)):
+            result = ChunkResult(
+                chunk_index=chunk.index,
+                success=True,
+                content=content,
+                tokens_used=share + (extra if n == 0 else 0),
+                duration_ms=duration_ms,
+                chunk_metadata=chunk.to_dict(),
+            )
+            if self.cache_enabled:
+                self._cache.set(self._cache_key(chunk, plan.query), result)
             results.append(result)
         
+        if trace:
+            trace.add_entry(
+                TraceEventType.CHUNK_END,
+                f"Chunks {', '.join(str(chunk.index) for chunk in pending)} processed",
+                duration_ms=duration_ms,
+                tokens_used=tokens,
+            )
+        
         return results
     
     def _process_chunk(
@@ -436,24 +1405,57 @@ class ChunkExecutor:
         
         # Check cache
         cache_key = self._cache_key(chunk, plan.query)
-        if self.cache_enabled and cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if trace:
-                trace.add_entry(
-                    TraceEventType.CHUNK_SKIP,
-                    f"Chunk {chunk.index} served from cache",
-                )
-            return ChunkResult(
-                chunk_index=chunk.index,
-                success=True,
-                content=cached.content,
-                was_cached=True,
-                chunk_metadata=chunk.to_dict(),
-            )
+        cached = self._cached_result(chunk, cache_key, trace)
+        if cached is not None:
+            return cached
+        
+        if self._would_exceed_budget(len(plan.chunk_prompt) + chunk.char_count):
+            return self._budget_skip(chunk, trace)
         
-        # Build prompt
-        prompt = plan.chunk_prompt + "\n\n---\n\n" + chunk.to_llm_context()
+        prompt = self._start_chunk(chunk, plan, trace)
         
+        try:
+            # Call LLM
+            content, tokens = self._complete(prompt)
+        except Exception as e:
+            return self._chunk_failed(chunk, e, start_time, trace)
+        
+        return self._chunk_done(chunk, cache_key, content, tokens, start_time, trace)
+    
+    def _cached_result(
+        self,
+        chunk: Chunk,
+        cache_key: str,
+        trace: Optional[ExecutionTrace],
+    ) -> Optional[ChunkResult]:
+        """Serve a chunk from the cache, or None on a miss."""
+        if not self.cache_enabled:
+            return None
+        
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        if trace:
+            trace.add_entry(
+                TraceEventType.CHUNK_SKIP,
+                f"Chunk {chunk.index} served from cache",
+            )
+        return ChunkResult(
+            chunk_index=chunk.index,
+            success=True,
+            content=cached.content,
+            was_cached=True,
+            chunk_metadata=chunk.to_dict(),
+        )
+    
+    def _start_chunk(
+        self,
+        chunk: Chunk,
+        plan: QueryPlan,
+        trace: Optional[ExecutionTrace],
+    ) -> str:
+        """Log the start of a chunk call and return its prompt."""
         if trace:
             trace.add_entry(
                 TraceEventType.CHUNK_START,
@@ -461,53 +1463,69 @@ class ChunkExecutor:
                 data={"chunk": chunk.to_dict()},
             )
         
-        try:
-            # Call LLM
-            content, tokens = self.llm.complete(prompt)
-            self._tokens_used += tokens
-            
-            duration_ms = (time.time() - start_time) * 1000
-            
-            result = ChunkResult(
-                chunk_index=chunk.index,
-                success=True,
-                content=content,
-                tokens_used=tokens,
+        return self._chunk_llm_prompt(plan.chunk_prompt, chunk)
+    
+    def _chunk_done(
+        self,
+        chunk: Chunk,
+        cache_key: str,
+        content: str,
+        tokens: int,
+        start_time: float,
+        trace: Optional[ExecutionTrace],
+    ) -> ChunkResult:
+        """Record and cache the result of a chunk call."""
+        self._tokens_used += tokens
+        
+        duration_ms = (time.time() - start_time) * 1000
+        
+        result = ChunkResult(
+            chunk_index=chunk.index,
+            success=True,
+            content=content,
+            tokens_used=tokens,
+            duration_ms=duration_ms,
+            chunk_metadata=chunk.to_dict(),
+        )
+        
+        # Cache result
+        if self.cache_enabled:
+            self._cache.set(cache_key, result)
+        
+        if trace:
+            trace.add_entry(
+                TraceEventType.CHUNK_END,
+                f"Chunk {chunk.index} processed",
+                data={"response_preview": content[:200]},
                 duration_ms=duration_ms,
-                chunk_metadata=chunk.to_dict(),
+                tokens_used=tokens,
             )
-            
-            # Cache result
-            if self.cache_enabled:
-                self._cache[cache_key] = result
-            
-            if trace:
-                trace.add_entry(
-                    TraceEventType.CHUNK_END,
-                    f"Chunk {chunk.index} processed",
-                    data={"response_preview": content[:200]},
-                    duration_ms=duration_ms,
-                    tokens_used=tokens,
-                )
-            
-            return result
-            
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            
-            if trace:
-                trace.add_entry(
-                    TraceEventType.LLM_CALL_ERROR,
-                    f"Chunk {chunk.index} failed: {e}",
-                    duration_ms=duration_ms,
-                )
-            
-            return ChunkResult(
-                chunk_index=chunk.index,
-                success=False,
-                content=f"Error: {e}",
+        
+        return result
+    
+    @staticmethod
+    def _chunk_failed(
+        chunk: Chunk,
+        error: Exception,
+        start_time: float,
+        trace: Optional[ExecutionTrace],
+    ) -> ChunkResult:
+        """Failed result for a chunk call that raised."""
+        duration_ms = (time.time() - start_time) * 1000
+        
+        if trace:
+            trace.add_entry(
+                TraceEventType.LLM_CALL_ERROR,
+                f"Chunk {chunk.index} failed: {error}",
                 duration_ms=duration_ms,
             )
+        
+        return ChunkResult(
+            chunk_index=chunk.index,
+            success=False,
+            content=f"Error: {error}",
+            duration_ms=duration_ms,
+        )
     
     def _aggregate_results(
         self,
@@ -535,7 +1553,7 @@ class ChunkExecutor:
         prompt = plan.aggregate_prompt + "\n\n---\n\n" + findings_text
         
         try:
-            content, tokens = self.llm.complete(prompt)
+            content, tokens = self._complete(prompt)
             self._tokens_used += tokens
             
             duration_ms = (time.time() - start_time) * 1000
@@ -559,11 +1577,29 @@ class ChunkExecutor:
             return f"Aggregation failed. Raw findings:\n\n{findings_text}"
     
     def _cache_key(self, chunk: Chunk, query: str) -> str:
-        """Generate cache key for chunk + query."""
-        content = f"{chunk.index}:{chunk.text_content[:1000]}:{query}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """
+        Generate cache key for chunk + query (covering the full chunk content).
+        
+        Provider and model are part of the key, so explorers on different
+        models sharing one cache file don't serve each other's answers.
+        """
+        key = hashlib.blake2b(chunk.content_digest, digest_size=16)
+        key.update(f"{self.llm.provider}:{self.llm.model}:{chunk.index}:{query}".encode())
+        return key.hexdigest()
     
     def clear_cache(self):
-        """Clear the result cache."""
+        """Clear the in-memory result cache (shared entries are kept)."""
         self._cache.clear()
+    
+    def purge_shared_cache(self):
+        """Clear the result cache, including this namespace's shared entries."""
+        self._cache.purge_shared()
+    
+    def close(self):
+        """Close the result cache's shared file, if any."""
+        self._cache.close()
+    
+    def cache_stats(self) -> dict:
+        """Result cache size and hit/miss/eviction counts."""
+        return self._cache.stats()
 
@@ -7,11 +7,12 @@ Provides optimized parsing, chunking, and formatting for:
 - Generic JSON arrays
 """
 
-from .discord import DiscordHandler
+from .discord import DiscordHandler, DiscordIndex
 from .generic import GenericHandler
 
 __all__ = [
     "DiscordHandler",
+    "DiscordIndex",
     "GenericHandler",
 ]
 
@@ -12,14 +12,56 @@ This handler provides:
 - Attachment and embed handling
 """
 
+import io
 import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional, Iterator, Any
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, Iterable, Iterator, Any, TextIO
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+# ijson (if available) streams messages out of an export one at a time
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None
 
-@dataclass
+# orjson (if available) speeds up whole-file parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Sort key for messages without a parseable timestamp (they sort first)
+_NO_TIMESTAMP = -(2 ** 63)
+
+# Sort messages by their precomputed integer timestamp (C-level key, int compares)
+_BY_TIMESTAMP = attrgetter("_ts_sort")
+
+
+def _timestamp_key(timestamp: str) -> int:
+    """Microseconds since the epoch for an ISO timestamp (naive ones taken as UTC)."""
+    if not timestamp:
+        return _NO_TIMESTAMP
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return _NO_TIMESTAMP
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // timedelta(microseconds=1)
+
+
+@dataclass(slots=True)
 class DiscordMessage:
     """Structured Discord message."""
     id: str
@@ -36,6 +78,12 @@ class DiscordMessage:
     reactions: list[dict] = field(default_factory=list)
     reply_to: Optional[str] = None
     
+    # Integer sort key parsed once from timestamp
+    _ts_sort: int = field(default=_NO_TIMESTAMP, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._ts_sort = _timestamp_key(self.timestamp)
+    
     @classmethod
     def from_dict(cls, data: dict) -> "DiscordMessage":
         """Parse a Discord message from JSON dict."""
@@ -85,7 +133,7 @@ class DiscordMessage:
         return "\n".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscordChannel:
     """Metadata for a Discord channel."""
     id: str
@@ -96,6 +144,19 @@ class DiscordChannel:
     message_count: int = 0
 
 
+@dataclass(slots=True)
+class DiscordIndex:
+    """
+    Lookup tables over a message set, for repeated thread-context queries.
+    
+    Built once by DiscordHandler.build_index(); rebuild it if the messages
+    change.
+    """
+    sorted_msgs: list[DiscordMessage]
+    id_to_idx: dict[str, int]  # Message ID -> position in sorted_msgs
+    reply_children: dict[str, list[int]]  # Message ID -> positions of its replies
+
+
 class DiscordHandler:
     """
     Handler for Discord export data.
@@ -175,6 +236,56 @@ class DiscordHandler:
                     if isinstance(item, dict) and "content" in item:
                         yield DiscordMessage.from_dict(item)
     
+    def parse_messages_from_file(
+        self,
+        file_path: str | Path,
+        channel_info: Optional[dict] = None,
+    ) -> Iterator[DiscordMessage]:
+        """
+        Parse Discord messages straight from an export file.
+        
+        With ijson installed, messages are streamed one at a time, so memory
+        stays flat however large the export is. Otherwise the file is parsed
+        whole (with orjson if available) and handed to parse_messages().
+        
+        Args:
+            file_path: Path to a channel export or messages array
+            channel_info: Optional channel metadata
+            
+        Yields:
+            DiscordMessage objects
+        """
+        if not HAS_IJSON:
+            with open(file_path, "rb") as f:
+                data = orjson.loads(f.read()) if HAS_ORJSON else json.load(f)
+            yield from self.parse_messages(data, channel_info)
+            return
+        
+        with open(file_path, "rb") as f:
+            head = f.read(64).lstrip()
+            f.seek(0)
+            
+            if head.startswith(b"{"):
+                # Channel exports list the channel before its messages
+                channel = next(ijson.items(f, "channel"), None)
+                f.seek(0)
+                
+                for msg_data in ijson.items(f, "messages.item", use_float=True):
+                    msg = DiscordMessage.from_dict(msg_data)
+                    if isinstance(channel, dict):
+                        msg.channel_id = channel.get("id", "unknown")
+                        msg.channel_name = channel.get("name", "unknown")
+                    yield msg
+            
+            elif head.startswith(b"["):
+                # Same rule as detect_format(): the first item decides
+                is_messages = None
+                for item in ijson.items(f, "item", use_float=True):
+                    if is_messages is None:
+                        is_messages = isinstance(item, dict) and "author" in item and "content" in item
+                    if is_messages or (isinstance(item, dict) and "content" in item):
+                        yield DiscordMessage.from_dict(item)
+    
     def group_by_channel(
         self,
         messages: list[DiscordMessage],
@@ -216,17 +327,66 @@ class DiscordHandler:
         include_metadata: bool = True,
     ) -> str:
         """Format a list of messages as a conversation."""
-        # Sort by timestamp
-        sorted_msgs = sorted(
-            messages,
-            key=lambda m: m.timestamp or ""
-        )
+        buffer = io.StringIO()
+        self.write_conversation(messages, buffer, include_metadata)
+        return buffer.getvalue()
+    
+    def write_conversation(
+        self,
+        messages: Iterable[DiscordMessage],
+        out: TextIO,
+        include_metadata: bool = True,
+        assume_sorted: bool = False,
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Write messages to `out` as a conversation, in timestamp order.
+        
+        Produces the same text as format_conversation() without holding it
+        all in memory; lines are written batch_size messages at a time.
+        Lists already in timestamp order (as Discord exports usually are)
+        are written without a sorted copy. With assume_sorted, any iterable,
+        such as parse_messages_from_file(), is streamed straight through.
+        
+        Returns:
+            Number of messages written
+        """
+        if not assume_sorted:
+            if not isinstance(messages, list):
+                messages = list(messages)
+            if any(
+                a._ts_sort > b._ts_sort
+                for a, b in zip(messages, islice(messages, 1, None))
+            ):
+                messages = sorted(messages, key=_BY_TIMESTAMP)
+        
+        count = 0
+        batch: list[str] = []
+        for msg in messages:
+            if count:
+                batch.append("\n\n")
+            batch.append(msg.to_text(include_metadata))
+            count += 1
+            
+            if len(batch) >= 2 * batch_size:
+                out.writelines(batch)
+                batch.clear()
+        
+        out.writelines(batch)
+        return count
+    
+    def build_index(self, messages: list[DiscordMessage]) -> DiscordIndex:
+        """Index messages by ID and by the message they reply to."""
+        sorted_msgs = sorted(messages, key=_BY_TIMESTAMP)
+        id_to_idx: dict[str, int] = {}
+        reply_children: dict[str, list[int]] = {}
         
-        lines = []
-        for msg in sorted_msgs:
-            lines.append(msg.to_text(include_metadata))
+        for i, msg in enumerate(sorted_msgs):
+            id_to_idx.setdefault(msg.id, i)
+            if msg.reply_to:
+                reply_children.setdefault(msg.reply_to, []).append(i)
         
-        return "\n\n".join(lines)
+        return DiscordIndex(sorted_msgs, id_to_idx, reply_children)
     
     def build_thread_context(
         self,
@@ -234,24 +394,24 @@ class DiscordHandler:
         target_message_id: str,
         context_before: int = 5,
         context_after: int = 5,
+        index: Optional[DiscordIndex] = None,
     ) -> list[DiscordMessage]:
         """
         Build context around a specific message.
         
-        Includes messages before and after, plus any replies.
+        Includes messages before and after, plus any replies. Pass an index
+        from build_index() to avoid re-sorting the messages on every call.
         """
-        # Find target message index
-        sorted_msgs = sorted(messages, key=lambda m: m.timestamp or "")
-        target_idx = None
-        
-        for i, msg in enumerate(sorted_msgs):
-            if msg.id == target_message_id:
-                target_idx = i
-                break
+        if index is None:
+            index = self.build_index(messages)
         
+        # Find target message index
+        target_idx = index.id_to_idx.get(target_message_id)
         if target_idx is None:
             return []
         
+        sorted_msgs = index.sorted_msgs
+        
         # Get context window
         start = max(0, target_idx - context_before)
         end = min(len(sorted_msgs), target_idx + context_after + 1)
@@ -259,47 +419,36 @@ class DiscordHandler:
         context = sorted_msgs[start:end]
         
         # Add any messages that reply to messages in context
-        context_ids = {m.id for m in context}
-        for msg in sorted_msgs:
-            if msg.reply_to and msg.reply_to in context_ids and msg not in context:
-                context.append(msg)
+        reply_idxs = {
+            i
+            for msg in context
+            for i in index.reply_children.get(msg.id, ())
+            if not start <= i < end
+        }
+        context.extend(sorted_msgs[i] for i in sorted(reply_idxs))
         
-        return sorted(context, key=lambda m: m.timestamp or "")
+        return sorted(context, key=_BY_TIMESTAMP)
     
     def get_statistics(
         self,
         messages: list[DiscordMessage],
     ) -> dict:
         """Calculate statistics for a set of messages."""
-        authors: dict[str, int] = {}
-        channels: dict[str, int] = {}
-        dates: dict[str, int] = {}
-        
-        for msg in messages:
-            # Count by author
-            authors[msg.author_name] = authors.get(msg.author_name, 0) + 1
-            
-            # Count by channel
-            channel = msg.channel_name or msg.channel_id or "unknown"
-            channels[channel] = channels.get(channel, 0) + 1
-            
-            # Count by date
-            date = msg.timestamp[:10] if msg.timestamp else "unknown"
-            dates[date] = dates.get(date, 0) + 1
+        # Counter over iterables counts in C; the key expressions match
+        # group_by_channel / group_by_date
+        authors = Counter(map(attrgetter("author_name"), messages))
+        channels = Counter(msg.channel_name or msg.channel_id or "unknown" for msg in messages)
+        dates = Counter(msg.timestamp[:10] if msg.timestamp else "unknown" for msg in messages)
         
         return {
             "total_messages": len(messages),
             "unique_authors": len(authors),
             "unique_channels": len(channels),
             "date_range": {
-                "earliest": min(dates.keys()) if dates else None,
-                "latest": max(dates.keys()) if dates else None,
+                "earliest": min(dates) if dates else None,
+                "latest": max(dates) if dates else None,
             },
-            "top_authors": sorted(
-                authors.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10],
-            "messages_per_channel": channels,
+            "top_authors": authors.most_common(10),
+            "messages_per_channel": dict(channels),
         }
 
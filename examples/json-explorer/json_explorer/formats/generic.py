@@ -6,11 +6,77 @@ a known format (Discord, Slack, etc.)
 """
 
 import json
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Iterator, Optional
 
+# orjson (if available) encodes records straight to UTF-8 bytes in C
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
 
-@dataclass
+# ijson (if available) streams records out of files larger than memory
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None
+
+# Field names reported per object by detect_structure; wider records are
+# cut off here rather than listing hundreds of keys
+MAX_SAMPLE_FIELDS = 64
+
+# Records of an array scanned by detect_structure for fields and types
+STRUCTURE_SAMPLE_SIZE = 100
+
+_JSON_TYPE_NAMES = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+# Key names suggesting a timestamp field, in one case-insensitive scan.
+# "date", "created", "updated" and "_at" all contain "at", and
+# "timestamp" contains "time", so the short indicators cover them.
+_TIMESTAMP_KEY = re.compile(r"time|at|when|on", re.IGNORECASE)
+
+
+def _json_dumps(value: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when installed (it only indents by 2)."""
+    if HAS_ORJSON and indent in (None, 2):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            # Non-str keys, oversized ints, etc. - stdlib handles these
+            pass
+    if indent is None:
+        # Same compact output as orjson; parsed JSON can't contain cycles
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), check_circular=False
+        ).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> tuple[tuple[str, Optional[int]], ...]:
+    """Split a dot path once into (key, list index or None) steps."""
+    return tuple(
+        (part, int(part) if part.isdecimal() else None)
+        for part in path.split(".")
+    )
+
+
+@dataclass(slots=True)
 class GenericRecord:
     """A generic JSON record with flattened access."""
     data: dict
@@ -22,15 +88,13 @@ class GenericRecord:
         
         Example: record.get("user.name") for {"user": {"name": "Alice"}}
         """
-        parts = path.split(".")
         value = self.data
         
-        for part in parts:
+        for key, idx in _compile_path(path):
             if isinstance(value, dict):
-                value = value.get(part)
-            elif isinstance(value, list) and part.isdigit():
-                idx = int(part)
-                if 0 <= idx < len(value):
+                value = value.get(key)
+            elif isinstance(value, list) and idx is not None:
+                if idx < len(value):
                     value = value[idx]
                 else:
                     return default
@@ -44,14 +108,22 @@ class GenericRecord:
     
     def to_text(self, max_length: int = 1000) -> str:
         """Convert to compact text representation."""
-        text = json.dumps(self.data, ensure_ascii=False, indent=None)
-        if len(text) > max_length:
+        buf = _json_dumps(self.data)
+        # A byte count within the limit means the character count is too
+        if len(buf) <= max_length:
+            return buf.decode("utf-8")
+        
+        # max_length characters span at most 4 * max_length UTF-8 bytes, so
+        # only that prefix is decoded (in place, via a memoryview)
+        head_bytes = 4 * max_length
+        text = str(memoryview(buf)[:head_bytes], "utf-8", "ignore")
+        if len(buf) > head_bytes or len(text) > max_length:
             return text[:max_length] + "..."
         return text
     
     def to_pretty_text(self, indent: int = 2) -> str:
         """Convert to pretty-printed text."""
-        return json.dumps(self.data, ensure_ascii=False, indent=indent)
+        return _json_dumps(self.data, indent).decode("utf-8")
 
 
 class GenericHandler:
@@ -71,8 +143,12 @@ class GenericHandler:
         Returns dict with:
         - root_type: "array", "object", "primitive"
         - record_count: Number of top-level records (for arrays)
-        - sample_fields: Fields found in samples
+        - sample_fields: Fields found in samples (first MAX_SAMPLE_FIELDS)
+        - field_types: JSON types seen per sample field (arrays of objects)
         - nested_arrays: Paths to nested arrays
+        
+        For arrays, fields are collected across the first
+        STRUCTURE_SAMPLE_SIZE records, so heterogeneous records are covered.
         """
         result = {
             "root_type": "unknown",
@@ -86,23 +162,34 @@ class GenericHandler:
             result["record_count"] = len(data)
             
             if data and isinstance(data[0], dict):
-                result["sample_fields"] = list(data[0].keys())
+                # One pass over the sample, recording every type seen per field
+                field_types: dict[str, set[str]] = {}
+                for record in islice(data, STRUCTURE_SAMPLE_SIZE):
+                    if isinstance(record, dict):
+                        for key, value in record.items():
+                            kind = _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+                            field_types.setdefault(key, set()).add(kind)
+                
+                result["sample_fields"] = list(islice(field_types, MAX_SAMPLE_FIELDS))
+                result["field_types"] = {
+                    key: sorted(field_types[key]) for key in result["sample_fields"]
+                }
                 
                 # Find nested arrays
-                for key, value in data[0].items():
-                    if isinstance(value, list):
-                        result["nested_arrays"].append(key)
+                result["nested_arrays"] = [
+                    key for key, kinds in field_types.items() if "array" in kinds
+                ]
         
         elif isinstance(data, dict):
             result["root_type"] = "object"
-            result["sample_fields"] = list(data.keys())
+            result["sample_fields"] = list(islice(data, MAX_SAMPLE_FIELDS))
             
             # Check for array fields that might be the main data
             for key, value in data.items():
                 if isinstance(value, list) and len(value) > 0:
                     result["nested_arrays"].append(key)
                     if isinstance(value[0], dict):
-                        result[f"{key}_fields"] = list(value[0].keys())
+                        result[f"{key}_fields"] = list(islice(value[0], MAX_SAMPLE_FIELDS))
         
         else:
             result["root_type"] = "primitive"
@@ -126,11 +213,10 @@ class GenericHandler:
         """
         # Navigate to path if specified
         if path:
-            parts = path.split(".")
             target = data
-            for part in parts:
+            for key, _ in _compile_path(path):
                 if isinstance(target, dict):
-                    target = target.get(part)
+                    target = target.get(key)
                 else:
                     target = None
                     break
@@ -147,15 +233,72 @@ class GenericHandler:
         elif isinstance(data, dict):
             yield GenericRecord(data=data, index=0)
     
+    def extract_records_streaming(
+        self,
+        file_path: str,
+        path: Optional[str] = None,
+    ) -> Iterator[GenericRecord]:
+        """
+        Extract records from a JSON file without loading it whole.
+        
+        With ijson installed, records under `path` are parsed one at a
+        time, so memory stays at a single record however large the file;
+        otherwise the file is loaded and passed to extract_records().
+        Yields the same records as extract_records() either way: one per
+        array element, or a single record when the target is an object.
+        
+        Args:
+            file_path: Path to the JSON file
+            path: Optional dot-path to array of records
+            
+        Yields:
+            GenericRecord objects
+        """
+        if not HAS_IJSON:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            yield from self.extract_records(data, path)
+            return
+        
+        # Peek at the first token of the target: an array streams its
+        # elements ("a.b" -> ijson prefix "a.b.item"), an object is one record
+        target = path or ""
+        with open(file_path, 'rb') as f:
+            first_event = next(
+                (event for prefix, event, _ in ijson.parse(f) if prefix == target),
+                None,
+            )
+        
+        if first_event == "start_map":
+            with open(file_path, 'rb') as f:
+                for item in ijson.items(f, target, use_float=True):
+                    yield GenericRecord(data=item, index=0)
+                    return
+        
+        if first_event != "start_array":
+            return
+        
+        item_prefix = f"{path}.item" if path else "item"
+        with open(file_path, 'rb') as f:
+            for i, item in enumerate(ijson.items(f, item_prefix, use_float=True)):
+                if isinstance(item, dict):
+                    yield GenericRecord(data=item, index=i)
+                else:
+                    yield GenericRecord(data={"value": item}, index=i)
+    
     def flatten_record(
         self,
         record: dict,
         prefix: str = "",
         max_depth: int = 5,
+        limit: Optional[int] = None,
     ) -> dict:
         """
         Flatten a nested record to single-level dict.
         
+        With a limit, stops once that many fields have been produced
+        (the first ones, in record order).
+        
         Example:
             {"user": {"name": "Alice"}} -> {"user.name": "Alice"}
         """
@@ -164,19 +307,30 @@ class GenericHandler:
         
         result = {}
         
-        for key, value in record.items():
-            full_key = f"{prefix}{key}"
-            
-            if isinstance(value, dict):
-                nested = self.flatten_record(value, f"{full_key}.", max_depth - 1)
-                result.update(nested)
-            elif isinstance(value, list):
-                if value and isinstance(value[0], dict):
-                    result[full_key] = f"[{len(value)} objects]"
+        # Depth-first over a stack of item iterators: same key order as a
+        # recursive walk, without a frame and a merged dict per nested object
+        stack = [(prefix, iter(record.items()), max_depth)]
+        while stack:
+            prefix, items, depth = stack[-1]
+            for key, value in items:
+                if isinstance(value, dict):
+                    # Child prefix built in one step, with no full_key in between
+                    if depth > 1:
+                        stack.append((f"{prefix}{key}.", iter(value.items()), depth - 1))
+                        break
+                    result[f"{prefix}{key}".rstrip(".")] = value
+                elif isinstance(value, list):
+                    if value and isinstance(value[0], dict):
+                        result[f"{prefix}{key}"] = f"[{len(value)} objects]"
+                    else:
+                        result[f"{prefix}{key}"] = value
                 else:
-                    result[full_key] = value
+                    result[f"{prefix}{key}"] = value
+                
+                if limit is not None and len(result) >= limit:
+                    return result
             else:
-                result[full_key] = value
+                stack.pop()
         
         return result
     
@@ -206,8 +360,8 @@ class GenericHandler:
             elif format_style == "pretty":
                 text = record.to_pretty_text()
             else:  # summary
-                flat = self.flatten_record(record.data)
-                text = "; ".join(f"{k}={v}" for k, v in list(flat.items())[:10])
+                flat = self.flatten_record(record.data, limit=10)
+                text = "; ".join(f"{k}={v}" for k, v in flat.items())
             
             # Add record marker
             formatted = f"[Record {record.index + 1}]\n{text}"
@@ -227,12 +381,19 @@ class GenericHandler:
         """
         searchable = []
         
-        for key, value in sample.items():
-            if isinstance(value, str) and len(value) > 10:
-                searchable.append(key)
-            elif isinstance(value, dict):
-                nested = self.find_searchable_fields(value)
-                searchable.extend(f"{key}.{n}" for n in nested)
+        # Depth-first over a stack of item iterators, as in flatten_record
+        stack = [("", iter(sample.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if isinstance(value, str):
+                    if len(value) > 10:
+                        searchable.append(f"{prefix}{key}")
+                elif isinstance(value, dict):
+                    stack.append((f"{prefix}{key}.", iter(value.items())))
+                    break
+            else:
+                stack.pop()
         
         return searchable
     
@@ -240,16 +401,10 @@ class GenericHandler:
         """
         Identify fields that look like timestamps.
         """
-        timestamp_indicators = [
-            "time", "date", "created", "updated", "timestamp", 
-            "at", "_at", "when", "on"
-        ]
-        
         candidates = []
         
         for key, value in sample.items():
-            key_lower = key.lower()
-            if any(ind in key_lower for ind in timestamp_indicators):
+            if _TIMESTAMP_KEY.search(key):
                 candidates.append(key)
             elif isinstance(value, str):
                 # Check if value looks like a timestamp
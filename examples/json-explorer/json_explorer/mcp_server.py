@@ -12,9 +12,14 @@ Design Philosophy:
 - Observable: Full trace available for debugging
 """
 
+import os
 import json
 import asyncio
-from typing import Optional, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Any, Callable
 from dataclasses import dataclass, asdict
 
 # MCP SDK (if available)
@@ -27,16 +32,43 @@ except ImportError:
     HAS_MCP = False
     Server = None
 
+# orjson (if available) serializes sample records in C
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
+# uvloop (if available, POSIX only) gives the stdio server a faster event loop
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+    uvloop = None
+
 from .core import JsonExplorer, QueryResult
 from .config import ExplorerConfig, TraceLevel
 
 
-@dataclass
+# Loaded explorers kept for instant reloads of unchanged files
+EXPLORER_CACHE_SIZE = 4
+
+NO_FILE_LOADED = "❌ No file loaded. Use load_json first."
+
+
+@dataclass(slots=True)
 class ServerState:
     """State for the MCP server."""
     explorer: Optional[JsonExplorer] = None
     loaded_file: Optional[str] = None
     last_result: Optional[QueryResult] = None
+    
+    # Schema views, computed once per load
+    schema_summary: Optional[str] = None
+    schema_dict: Optional[dict] = None
+    schema_etag: Optional[str] = None
 
 
 class JsonExplorerMCPServer:
@@ -64,6 +96,11 @@ class JsonExplorerMCPServer:
         self.config = config or ExplorerConfig()
         self.allowed_paths = allowed_paths or []  # Empty = allow all
         self.state = ServerState()
+        # Explorer calls run in worker threads so the stdio loop stays
+        # responsive, but one at a time: an explorer isn't safe to share
+        self._explorer_lock = asyncio.Lock()
+        # (path, mtime, size) -> explorer, so reloading an unchanged file skips the parse
+        self._explorers: OrderedDict[tuple, JsonExplorer] = OrderedDict()
         
         if HAS_MCP:
             self.server = Server("json-explorer")
@@ -177,44 +214,75 @@ class JsonExplorerMCPServer:
         if not self.allowed_paths:
             return True
         
-        from pathlib import Path
         abs_path = str(Path(file_path).resolve())
         
         return any(abs_path.startswith(allowed) for allowed in self.allowed_paths)
     
+    async def _run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Run blocking explorer work off the event loop."""
+        async with self._explorer_lock:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
     async def _load_json(self, file_path: str) -> str:
         """Load a JSON file."""
         if not self._check_path_allowed(file_path):
             return f"Access denied: {file_path} is not in allowed paths"
         
-        # Create new explorer
-        self.state.explorer = JsonExplorer(config=self.config)
-        
         try:
-            schema = self.state.explorer.load(file_path)
+            self.state.explorer = await self._explorer_for(file_path)
             self.state.loaded_file = file_path
+            self.state.schema_summary = self.state.explorer.schema.summary()
             
             return f"""✅ Loaded: {file_path}
 
-{schema.summary()}"""
+{self.state.schema_summary}"""
         
         except Exception as e:
             self.state.explorer = None
             return f"❌ Failed to load: {e}"
     
+    async def _explorer_for(self, file_path: str) -> JsonExplorer:
+        """Explorer with file_path loaded, reused if the file hasn't changed."""
+        key = self._file_key(file_path)
+        explorer = self._explorers.get(key) if key else None
+        if explorer is not None:
+            self._explorers.move_to_end(key)
+            return explorer
+        
+        explorer = JsonExplorer(config=self.config)
+        await self._run_blocking(explorer.load, file_path)
+        
+        if key and self.config.enable_caching:
+            self._explorers[key] = explorer
+            if len(self._explorers) > EXPLORER_CACHE_SIZE:
+                _, evicted = self._explorers.popitem(last=False)
+                evicted.close()
+        return explorer
+    
+    @staticmethod
+    def _file_key(file_path: str) -> Optional[tuple]:
+        """Cache key identifying this version of the file, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None  # Let load() report the problem
+        return (str(Path(file_path).resolve()), st.st_mtime_ns, st.st_size)
+    
     async def _analyze_schema(self) -> str:
         """Get schema analysis."""
         if not self.state.explorer:
-            return "❌ No file loaded. Use load_json first."
+            return NO_FILE_LOADED
         
-        return self.state.explorer.analyze_schema()
+        return self.state.schema_summary
     
     async def _query(self, question: str, save_trace: bool = False) -> str:
         """Query the loaded data."""
         if not self.state.explorer:
-            return "❌ No file loaded. Use load_json first."
+            return NO_FILE_LOADED
         
-        result = self.state.explorer.query(question, save_trace=save_trace)
+        result = await self._run_blocking(
+            self.state.explorer.query, question, save_trace=save_trace
+        )
         self.state.last_result = result
         
         if result.success:
@@ -228,9 +296,12 @@ class JsonExplorerMCPServer:
     async def _get_sample(self, count: int = 5) -> str:
         """Get sample records."""
         if not self.state.explorer:
-            return "❌ No file loaded. Use load_json first."
+            return NO_FILE_LOADED
         
-        samples = self.state.explorer.get_sample(count)
+        samples = await self._run_blocking(self.state.explorer.get_sample, count)
+        if HAS_ORJSON:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(samples, option=option).decode("utf-8")
         return json.dumps(samples, indent=2, ensure_ascii=False)
     
     async def _get_trace(self, format: str = "summary") -> str:
@@ -280,11 +351,13 @@ class JsonExplorerHTTPServer:
         self.host = host
         self.port = port
         self.state = ServerState()
+        # Requests are served on threads; queries on one explorer must not overlap
+        self._query_lock = threading.Lock()
     
     def create_app(self):
         """Create Flask/FastAPI app (if available)."""
         try:
-            from flask import Flask, request, jsonify
+            from flask import Flask, Response, request, jsonify
             app = Flask(__name__)
             
             @app.route("/health")
@@ -300,20 +373,28 @@ class JsonExplorerHTTPServer:
                     return jsonify({"error": "file_path required"}), 400
                 
                 try:
-                    self.state.explorer = JsonExplorer(config=self.config)
-                    schema = self.state.explorer.load(file_path)
+                    # Load into a fresh explorer, then swap it in, so requests
+                    # in flight keep the one they started with
+                    explorer = JsonExplorer(config=self.config)
+                    schema_dict = explorer.load(file_path).to_dict()
+                    schema_json = json.dumps(schema_dict, sort_keys=True).encode("utf-8")
+                    
+                    self.state.schema_dict = schema_dict
+                    self.state.schema_etag = hashlib.blake2b(schema_json, digest_size=8).hexdigest()
+                    self.state.explorer = explorer
                     self.state.loaded_file = file_path
                     
                     return jsonify({
                         "status": "loaded",
-                        "schema": schema.to_dict()
+                        "schema": schema_dict
                     })
                 except Exception as e:
                     return jsonify({"error": str(e)}), 500
             
             @app.route("/query", methods=["POST"])
             def query():
-                if not self.state.explorer:
+                explorer = self.state.explorer
+                if not explorer:
                     return jsonify({"error": "No file loaded"}), 400
                 
                 data = request.json
@@ -322,7 +403,8 @@ class JsonExplorerHTTPServer:
                 if not question:
                     return jsonify({"error": "question required"}), 400
                 
-                result = self.state.explorer.query(question)
+                with self._query_lock:
+                    result = explorer.query(question)
                 
                 return jsonify({
                     "answer": result.answer,
@@ -337,7 +419,11 @@ class JsonExplorerHTTPServer:
                 if not self.state.explorer:
                     return jsonify({"error": "No file loaded"}), 400
                 
-                return jsonify(self.state.explorer.schema.to_dict())
+                # Clients revalidate with the ETag; it changes on the next /load
+                response = jsonify(self.state.schema_dict)
+                response.set_etag(self.state.schema_etag)
+                response.cache_control.no_cache = True
+                return response.make_conditional(request)
             
             @app.route("/sample")
             def sample():
@@ -346,6 +432,10 @@ class JsonExplorerHTTPServer:
                 
                 count = request.args.get("count", 5, type=int)
                 samples = self.state.explorer.get_sample(count)
+                if HAS_ORJSON:
+                    # Already UTF-8 bytes; no re-encoding on the way out
+                    body = orjson.dumps(samples, option=orjson.OPT_NON_STR_KEYS)
+                    return Response(body, mimetype="application/json")
                 return jsonify(samples)
             
             return app
@@ -356,7 +446,9 @@ class JsonExplorerHTTPServer:
     def run(self):
         """Run the HTTP server."""
         app = self.create_app()
-        app.run(host=self.host, port=self.port)
+        # Threaded, so health checks and schema/sample reads aren't stuck
+        # behind a long-running query
+        app.run(host=self.host, port=self.port, threaded=True)
 
 
 def main():
@@ -407,7 +499,7 @@ def main():
             config=config,
             allowed_paths=args.allowed_paths,
         )
-        asyncio.run(server.run())
+        (uvloop.run if HAS_UVLOOP else asyncio.run)(server.run())
     
     else:  # http
         server = JsonExplorerHTTPServer(
@@ -15,6 +15,31 @@ from enum import Enum
 
 from .schema import JsonSchema, JsonFormat
 
+# pyahocorasick (if available) finds every intent indicator in one scan
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+    ahocorasick = None
+
+
+# Phrasings like "what do they say about X" that also call for exhaustive extraction
+_OPINION_RE = re.compile("|".join(f"(?:{p})" for p in (
+    r"what (?:do|are|did) (?:people|they|users?|members?) (?:say|think|mention)",
+    r"opinions? (?:on|about|regarding)",
+    r"thoughts? (?:on|about|regarding)",
+    r"feedback (?:on|about|regarding)",
+    r"discussion (?:on|about|regarding)",
+)))
+
+# Filter extraction patterns (matched against the lowercased query,
+# except quoted phrases which keep their case)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_ABOUT_RE = re.compile(r'(?:about|regarding|mentioning|related to)\s+(\w+(?:\s+\w+)?)')
+_CHANNEL_RE = re.compile(r'(?:in|from|channel)\s+#?(\w+)')
+_AUTHOR_RE = re.compile(r'(?:by|from user|user)\s+@?(\w+)')
+
 
 class QueryIntent(Enum):
     """Types of query intents we can detect."""
@@ -28,6 +53,51 @@ class QueryIntent(Enum):
     EXHAUSTIVE_EXTRACT = "exhaustive"    # Find EVERY single mention with full context and citations
 
 
+# Indicator phrases per intent, in precedence order: the first group
+# with a phrase in the query wins
+_INTENT_INDICATORS: tuple[tuple[QueryIntent, tuple[str, ...]], ...] = (
+    # EXHAUSTIVE extraction - for getting EVERY mention with citations
+    # Triggers: "what are people saying about X", "everything about X", "all mentions of X"
+    (QueryIntent.EXHAUSTIVE_EXTRACT, (
+        "what are people saying",
+        "everything about",
+        "all mentions",
+        "every mention",
+        "everything said about",
+        "all the discussions",
+        "comprehensive",
+        "exhaustive",
+        "each instance",
+        "every single",
+        "all instances",
+        "cite all",
+        "full context",
+    )),
+    (QueryIntent.SEARCH, ("find", "search", "look for", "where", "who said", "mentions")),
+    (QueryIntent.COUNT, ("how many", "count", "number of", "total")),
+    (QueryIntent.TIMELINE, ("when", "timeline", "over time", "history", "chronological")),
+    (QueryIntent.COMPARE, ("compare", "difference", "versus", "vs", "between")),
+    (QueryIntent.EXTRACT, ("extract", "list", "get all", "show me all")),
+    # Summarize is default for open-ended questions
+    (QueryIntent.SUMMARIZE, ("summarize", "summary", "main topics", "what about", "discuss")),
+)
+_NO_INDICATOR = (len(_INTENT_INDICATORS), None)
+
+
+def _build_intent_automaton():
+    """Automaton mapping each indicator to its (precedence rank, intent)."""
+    automaton = ahocorasick.Automaton()
+    for rank, (intent, indicators) in enumerate(_INTENT_INDICATORS):
+        for indicator in indicators:
+            if indicator not in automaton:  # Keep the higher-precedence intent
+                automaton.add_word(indicator, (rank, intent))
+    automaton.make_automaton()
+    return automaton
+
+
+_INTENT_AUTOMATON = _build_intent_automaton() if HAS_AHOCORASICK else None
+
+
 @dataclass
 class FilterCriteria:
     """Criteria for filtering records before LLM processing."""
@@ -94,6 +164,7 @@ class QueryPlan:
     require_full_scan: bool = False  # Must process all chunks
     chunk_limit: Optional[int] = None  # Max chunks to process
     parallel_ok: bool = True  # Safe to parallelize
+    batch_ok: bool = False  # Send chunk calls as one provider batch job (non-interactive)
     
     # LLM prompts
     chunk_prompt: str = ""  # Prompt for each chunk
@@ -115,6 +186,7 @@ class QueryPlan:
             "require_full_scan": self.require_full_scan,
             "chunk_limit": self.chunk_limit,
             "parallel_ok": self.parallel_ok,
+            "batch_ok": self.batch_ok,
             "estimated_chunks": self.estimated_chunks,
             "estimated_tokens": self.estimated_tokens,
             "reasoning": self.reasoning,
@@ -132,8 +204,9 @@ class QueryPlanner:
     - Estimate resource usage
     """
     
-    def __init__(self, schema: JsonSchema):
+    def __init__(self, schema: JsonSchema, batch_ok: bool = False):
         self.schema = schema
+        self.batch_ok = batch_ok  # Plans may use the provider batch API
     
     def plan(self, query: str) -> QueryPlan:
         """
@@ -172,6 +245,7 @@ class QueryPlanner:
             require_full_scan=require_full_scan,
             chunk_limit=100 if not require_full_scan else None,
             parallel_ok=intent != QueryIntent.TIMELINE,
+            batch_ok=self.batch_ok,
             chunk_prompt=chunk_prompt,
             aggregate_prompt=aggregate_prompt,
             estimated_chunks=estimated_chunks,
@@ -182,68 +256,18 @@ class QueryPlanner:
     def _detect_intent(self, query: str) -> QueryIntent:
         """Detect the primary intent of the query."""
         query_lower = query.lower()
+        _, intent = self._match_indicators(query_lower)
         
-        # EXHAUSTIVE extraction indicators - for getting EVERY mention with citations
-        # Triggers: "what are people saying about X", "everything about X", "all mentions of X"
-        exhaustive_indicators = [
-            "what are people saying",
-            "everything about",
-            "all mentions",
-            "every mention",
-            "everything said about",
-            "all the discussions",
-            "comprehensive",
-            "exhaustive",
-            "each instance",
-            "every single",
-            "all instances",
-            "cite all",
-            "full context",
-        ]
-        if any(ind in query_lower for ind in exhaustive_indicators):
-            return QueryIntent.EXHAUSTIVE_EXTRACT
+        if intent == QueryIntent.EXHAUSTIVE_EXTRACT:
+            return intent
         
         # Also trigger exhaustive for patterns like "what do they say about X"
-        opinion_patterns = [
-            r"what (?:do|are|did) (?:people|they|users?|members?) (?:say|think|mention)",
-            r"opinions? (?:on|about|regarding)",
-            r"thoughts? (?:on|about|regarding)",
-            r"feedback (?:on|about|regarding)",
-            r"discussion (?:on|about|regarding)",
-        ]
-        for pattern in opinion_patterns:
-            if re.search(pattern, query_lower):
-                return QueryIntent.EXHAUSTIVE_EXTRACT
-        
-        # Search indicators
-        search_indicators = ["find", "search", "look for", "where", "who said", "mentions"]
-        if any(ind in query_lower for ind in search_indicators):
-            return QueryIntent.SEARCH
-        
-        # Count indicators
-        count_indicators = ["how many", "count", "number of", "total"]
-        if any(ind in query_lower for ind in count_indicators):
-            return QueryIntent.COUNT
-        
-        # Timeline indicators
-        timeline_indicators = ["when", "timeline", "over time", "history", "chronological"]
-        if any(ind in query_lower for ind in timeline_indicators):
-            return QueryIntent.TIMELINE
-        
-        # Compare indicators
-        compare_indicators = ["compare", "difference", "versus", "vs", "between"]
-        if any(ind in query_lower for ind in compare_indicators):
-            return QueryIntent.COMPARE
-        
-        # Extract indicators
-        extract_indicators = ["extract", "list", "get all", "show me all"]
-        if any(ind in query_lower for ind in extract_indicators):
-            return QueryIntent.EXTRACT
-        
-        # Summarize is default for open-ended questions
-        summarize_indicators = ["summarize", "summary", "main topics", "what about", "discuss"]
-        if any(ind in query_lower for ind in summarize_indicators):
-            return QueryIntent.SUMMARIZE
+        # (ahead of every other indicator group)
+        if _OPINION_RE.search(query_lower):
+            return QueryIntent.EXHAUSTIVE_EXTRACT
+        
+        if intent is not None:
+            return intent
         
         # Default to analysis for complex questions
         if "?" in query or query_lower.startswith(("what", "why", "how")):
@@ -251,28 +275,45 @@ class QueryPlanner:
         
         return QueryIntent.SUMMARIZE
     
+    @staticmethod
+    def _match_indicators(query_lower: str) -> tuple[int, Optional[QueryIntent]]:
+        """Highest-precedence (rank, intent) with an indicator in the query."""
+        if _INTENT_AUTOMATON is None:
+            for rank, (intent, indicators) in enumerate(_INTENT_INDICATORS):
+                if any(ind in query_lower for ind in indicators):
+                    return rank, intent
+            return _NO_INDICATOR
+        
+        best = _NO_INDICATOR
+        for _, hit in _INTENT_AUTOMATON.iter(query_lower):
+            if hit[0] < best[0]:
+                best = hit
+                if best[0] == 0:
+                    break
+        return best
+    
     def _extract_filters(self, query: str) -> FilterCriteria:
         """Extract filter criteria from query."""
         criteria = FilterCriteria()
         query_lower = query.lower()
         
         # Extract quoted phrases as exact keywords
-        quoted = re.findall(r'"([^"]+)"', query)
+        quoted = _QUOTED_RE.findall(query)
         criteria.keywords.extend(quoted)
         
         # Extract keywords after "about", "regarding", "mentioning"
-        about_match = re.search(r'(?:about|regarding|mentioning|related to)\s+(\w+(?:\s+\w+)?)', query_lower)
+        about_match = _ABOUT_RE.search(query_lower)
         if about_match:
             criteria.keywords.append(about_match.group(1))
         
         # Extract channel filter for Discord
         if self.schema.format == JsonFormat.DISCORD:
-            channel_match = re.search(r'(?:in|from|channel)\s+#?(\w+)', query_lower)
+            channel_match = _CHANNEL_RE.search(query_lower)
             if channel_match:
                 criteria.channel_filter = channel_match.group(1)
         
         # Extract author filter
-        author_match = re.search(r'(?:by|from user|user)\s+@?(\w+)', query_lower)
+        author_match = _AUTHOR_RE.search(query_lower)
         if author_match:
             criteria.author_filter = author_match.group(1)
         
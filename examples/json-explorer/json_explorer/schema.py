@@ -13,6 +13,15 @@ from typing import Optional, Any, Iterator
 from pathlib import Path
 from enum import Enum
 
+# ijson (if available) lets array files be sampled and counted while
+# holding only one record in memory
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+    ijson = None
+
 
 class JsonFormat(Enum):
     """Known JSON export formats with specialized handling."""
@@ -193,8 +202,9 @@ class SchemaAnalyzer:
     
     def _analyze_array(self, f, file_size: int) -> JsonSchema:
         """Analyze a JSON array (most common: array of records)."""
-        # For simplicity, use json.load for now
-        # In production, use ijson for streaming
+        if HAS_IJSON:
+            return self._analyze_array_streaming(f.name, file_size)
+        
         f.seek(0)
         try:
             data = json.load(f)
@@ -204,9 +214,50 @@ class SchemaAnalyzer:
         if not isinstance(data, list):
             raise ValueError("Expected JSON array")
         
+        return self._analyze_records(data, file_size)
+    
+    def _analyze_array_streaming(self, file_path: str, file_size: int) -> JsonSchema:
+        """Sample and count an array's records with ijson, one record at a time."""
+        sample = []
+        total_records = 0
+        
+        with open(file_path, 'rb') as f:
+            try:
+                for record in ijson.items(f, "item", use_float=True):
+                    if total_records < self.sample_size:
+                        sample.append(record)
+                    total_records += 1
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON: {e}")
+        
+        return self._analyze_records(sample, file_size, total_records)
+    
+    def analyze_data(self, data: list[dict]) -> JsonSchema:
+        """
+        Analyze records that are already in memory.
+        
+        Args:
+            data: List of records
+            
+        Returns:
+            JsonSchema with structure information (file size is 0)
+        """
+        if not isinstance(data, list):
+            raise ValueError("Expected a list of records")
+        
+        return self._analyze_records(data, file_size=0)
+    
+    def _analyze_records(
+        self,
+        data: list,
+        file_size: int,
+        total_records: Optional[int] = None,
+    ) -> JsonSchema:
+        """Build the schema for a parsed array of records (or a sample of it)."""
         # Sample records
         sample = data[:self.sample_size]
-        total_records = len(data)
+        if total_records is None:
+            total_records = len(data)
         
         # Detect format
         json_format = self._detect_format(sample)
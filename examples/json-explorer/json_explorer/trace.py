@@ -17,6 +17,14 @@ from enum import Enum
 
 from .config import TraceLevel
 
+# orjson (if available) for fast trace serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 
 class TraceEventType(Enum):
     """Types of events in execution trace."""
@@ -296,6 +304,17 @@ class ExecutionTrace:
         """Serialize to JSON string."""
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 encoded JSON (2-space indent), via orjson when installed."""
+        data = self.to_dict()
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # Non-str keys, oversized ints, etc. in entry data
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    
     def to_markdown(self, level: TraceLevel = TraceLevel.FULL) -> str:
         """Format trace as markdown document."""
         lines = [
@@ -415,8 +434,8 @@ class ExecutionTrace:
         
         if format in ["json", "both"]:
             json_path = output_dir / f"{base_name}.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(self.to_json())
+            with open(json_path, 'wb') as f:
+                f.write(self.to_json_bytes())
         
         if format in ["markdown", "both"]:
             md_path = output_dir / f"{base_name}.md"